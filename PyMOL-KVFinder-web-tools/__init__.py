@@ -23,20 +23,135 @@
 
 from __future__ import absolute_import, annotations, print_function
 
+import copy
 import json
 import os
-from typing import Any, Dict, Optional
-
+import re
+import shutil
+import threading
+from functools import lru_cache, partial
+from math import cos, floor, pi, sin
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+import numpy as np
 import toml
-from PyQt6 import QtCore, QtWidgets
+from pymol import cmd
+from pymol.cgo import BEGIN, COLOR, END, LINES, VERTEX
+from PyQt6 import QtCore, QtGui, QtNetwork, QtWidgets
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+try:
+    import tomllib as _tomllib
+except ImportError:
+    try:
+        import tomli as _tomllib
+    except ImportError:
+        _tomllib = toml
+
+try:
+    import tomli_w as _tomli_w
+except ImportError:
+    _tomli_w = None
 
 __name__ = "PyMOL KVFinder-web Tools"
 __version__ = "v1.0.0"
 
 
+# Grid spacing of KVFinder-web 3D-grid (A)
+_GRID_STEP = 0.6
+
+# Whether paths returned by Qt, that use "/" separators, must be converted to native separators
+_NEEDS_NATIVE_SEP = os.sep == "\\"
+
+# Directory of jobs registered by the plugin
+_KVFINDER_DIR = os.path.join(os.path.expanduser("~"), ".KVFinder-web")
+
+# Timeout of KVFinder-web service status checks (msec)
+_SERVER_STATUS_TIMEOUT = 2000
+
+# Display names of job status
+_STATUS_DISPLAY = {
+    "queued": "Queued",
+    "running": "Running",
+    "completed": "Completed",
+    "error": "Error",
+}
+
+# Whether each vertex (P1, ..., P8) of a box is on the maximum (True) or minimum
+# (False) side of the center of the box in x, y and z axes
+_BOX_CORNERS = np.array(
+    [
+        [False, False, False],
+        [True, False, False],
+        [False, True, False],
+        [False, False, True],
+        [True, True, False],
+        [True, False, True],
+        [False, True, True],
+        [True, True, True],
+    ]
+)
+
+# PyMOL objects created by the plugin, that are not listed as input structures
+_PLUGIN_OBJECTS = frozenset({"box", "grid", "cavities", "residues", "target_exclusive"})
+
+# Pairs of vertices (P1, ..., P8) connected by the edges of a box
+_BOX_EDGES = (
+    (2, 6),
+    (1, 5),
+    (4, 7),
+    (1, 4),
+    (3, 5),
+    (3, 6),
+    (2, 4),
+    (5, 7),
+    (6, 7),
+    (0, 1),
+    (0, 2),
+    (0, 3),
+)
+
+# Names of the pseudoatoms of a box and of their colors defined in PyMOL
+_BOX_ATOM_NAMES = (
+    "v2",
+    "v3",
+    "v4",
+    "v5",
+    "v6",
+    "v7",
+    "v8",
+    "v1x",
+    "v1y",
+    "v1z",
+    "v2x",
+    "v3y",
+    "v4z",
+)
+_BOX_COLOR_NAMES = tuple(f"{name}color" for name in _BOX_ATOM_NAMES)
+
+# Lines of parKVFinder log rewritten (target structure) or dropped (detection dictionary) when exported
+_LOG_RE = re.compile(
+    r"^.*(Running parKVFinder for: |Dictionary: ).*(\n?)", re.MULTILINE
+)
+
 # global reference to avoid garbage collection of our dialog
 dialog = None
 worker = None
+# global reference to share the parsed about text between dialogs
+about_document = None
+# global network manager of the GUI thread, shared between dialogs
+network_manager = None
+# global cache of parsed TOML files, invalidated by changes of their modification time and size
+toml_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+# global cache of jobs registered inside ~/.KVFinder-web directory, invalidated by changes of its modification time
+jobs_cache: Optional[Tuple[int, list]] = None
+# global signatures of files loaded as PyMOL objects, keyed by object name
+loaded_files: Dict[str, Tuple[str, int]] = {}
 
 
 ##########################################
@@ -60,8 +175,6 @@ data_limit = "5 Mb"                      #
 time_restart_job_checks = 5000           #
 time_server_down = 60000                 #
 time_no_jobs = 5000                      #
-time_between_jobs = 2000                 #
-time_wait_status = 5000                  #
 #                                        #
 # Times jobs completed with downloaded   #
 # results are not checked in service     #
@@ -126,12 +239,34 @@ class _Default(object):
         Length to limit a space around a ligand (A)
     """
 
+    __slots__ = (
+        "probe_in",
+        "probe_out",
+        "removal_distance",
+        "volume_cutoff",
+        "base_name",
+        "output_dir_path",
+        "box_adjustment",
+        "x",
+        "y",
+        "z",
+        "min_x",
+        "max_x",
+        "min_y",
+        "max_y",
+        "min_z",
+        "max_z",
+        "angle1",
+        "angle2",
+        "padding",
+        "ligand_adjustment",
+        "ligand_cutoff",
+    )
+
     def __init__(self):
-        super(_Default, self).__init__()
         """
         Initialize class with defult detection parameters in attributes
         """
-
         # Main Parameters #
         self.probe_in = 1.4
         self.probe_out = 4.0
@@ -193,6 +328,28 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
     # Signals
     msgbox_signal = QtCore.pyqtSignal(bool)
 
+    # Results listed on the results tab
+    _RESULTS_LISTS = (
+        "VOLUME",
+        "AREA",
+        "AVG_DEPTH",
+        "MAX_DEPTH",
+        "AVG_HYDROPATHY",
+        "RESIDUES",
+    )
+
+    # Spin boxes of box adjustment
+    _BOX_SPINS = (
+        "min_x",
+        "max_x",
+        "min_y",
+        "max_y",
+        "min_z",
+        "max_z",
+        "angle1",
+        "angle2",
+    )
+
     def __init__(self, server=server, path=path):
         super(PyMOLKVFinderWebTools, self).__init__()
         """
@@ -205,8 +362,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         path: str
             Server path to communicate with KVFinder-web service (Default: /api)
         """
-        from PyQt6.QtNetwork import QNetworkAccessManager
-
         # Define Default Parameters
         self._default = _Default()
 
@@ -221,20 +376,37 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         self.y = 0.0
         self.z = 0.0
 
+        # Whether colors of box vertices are defined in PyMOL
+        self._box_colors_defined = False
+
+        # Whether box object was created by draw_box and can be moved in place
+        self._box_created = False
+
         # Define server
-        self.server = f"{server}/{path.replace('/', '')}"
-        self.network_manager = QNetworkAccessManager()
+        self.server = urljoin(f"{server.rstrip('/')}/", path.strip("/"))
+        self.network_manager = _get_network_manager()
+
+        # Define job submission request
+        self.create_request = QtNetwork.QNetworkRequest(
+            QtCore.QUrl(f"{self.server}/create")
+        )
+        self.create_request.setHeader(
+            QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader,
+            "application/json",
+        )
+        self.create_request.setAttribute(
+            QtNetwork.QNetworkRequest.Attribute.Http2AllowedAttribute, True
+        )
 
         # Check server status
-        status = _check_server_status(self.server)
-        self.set_server_status(status)
+        self._request_server_status()
 
         # Create ./KVFinder-web directory for jobs
-        jobs_dir = os.path.join(os.path.expanduser("~"), ".KVFinder-web")
-        try:
-            os.mkdir(jobs_dir)
-        except FileExistsError:
-            pass
+        os.makedirs(_KVFINDER_DIR, exist_ok=True)
+
+        # Get registered jobs
+        jobs = _get_jobs()
+        self._known_jobs = set(jobs)
 
         # Start Worker thread to handle available jobs
         global worker
@@ -242,7 +414,7 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             worker = self._start_worker_thread()
 
         # Get available jobs
-        self.available_jobs.addItems(_get_jobs())
+        self.available_jobs.addItems(jobs)
         self.fill_job_information()
 
         # Results
@@ -251,12 +423,20 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         self.ligand_pdb = None
         self.cavity_pdb = None
 
+        # Job submission messages, reused between POST responses
+        self._msg_info = Message("")
+        self._msg_error = Message("")
+        # Job addition message, kept apart from job submission messages that may be showing
+        self._msg_added = Message("")
+        self._msg_critical = QtWidgets.QMessageBox(self)
+        self._msg_critical.setIcon(QtWidgets.QMessageBox.Icon.Critical)
+        self._msg_critical.setWindowTitle("Job Submission")
+
     def initialize_gui(self) -> None:
         """
         This method initializes graphical user interface from .ui file, bind scrollbars to QListWidgets and hooks up buttons with callbacks.
         """
         # Import the PyQt interface
-        from PyQt6 import QtWidgets
         from PyQt6.uic import loadUi
 
         # populate the QMainWindow from our *.ui file
@@ -272,7 +452,7 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         self.residues_list.setVerticalScrollBar(scroll_bar_residues)
 
         # about text
-        self.about_text.setHtml(about_text)
+        self.about_text.setDocument(_get_about_document())
 
         # Buttons Callback
 
@@ -284,7 +464,7 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         # hook up Parameters button callbacks
         self.button_browse.clicked.connect(self.select_directory)
-        self.refresh_input.clicked.connect(lambda: self.refresh(self.input))
+        self.refresh_input.clicked.connect(partial(self.refresh, self.input))
 
         # hook up Search Space button callbacks
         # Box Adjustment
@@ -293,7 +473,24 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         self.button_redraw_box.clicked.connect(self.redraw_box)
         self.button_box_adjustment_help.clicked.connect(self.box_adjustment_help)
         # Ligand Adjustment
-        self.refresh_ligand.clicked.connect(lambda: self.refresh(self.ligand))
+        self.refresh_ligand.clicked.connect(partial(self.refresh, self.ligand))
+
+        # Bound callbacks of results lists
+        self._show_cav_va = partial(
+            self.show_cavities, self.volume_list, self.area_list
+        )
+        self._show_cav_av = partial(
+            self.show_cavities, self.area_list, self.volume_list
+        )
+        self._show_dep_am = partial(
+            self.show_depth, self.avg_depth_list, self.max_depth_list
+        )
+        self._show_dep_ma = partial(
+            self.show_depth, self.max_depth_list, self.avg_depth_list
+        )
+        self._show_hyd = partial(self.show_hydropathy, self.avg_hydropathy_list)
+        self._pending_selection = {}
+        self._list_tags = {}
 
         # hook up methods to results tab
         # Jobs
@@ -304,27 +501,19 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         self.button_browse_results.clicked.connect(self.select_results_file)
         self.button_load_results.clicked.connect(self.load_results)
         self.volume_list.itemSelectionChanged.connect(
-            lambda list1=self.volume_list, list2=self.area_list: self.show_cavities(
-                list1, list2
-            )
+            partial(self._schedule_selection, self._show_cav_va)
         )
         self.area_list.itemSelectionChanged.connect(
-            lambda list1=self.area_list, list2=self.volume_list: self.show_cavities(
-                list1, list2
-            )
+            partial(self._schedule_selection, self._show_cav_av)
         )
         self.avg_depth_list.itemSelectionChanged.connect(
-            lambda list1=self.avg_depth_list, list2=self.max_depth_list: self.show_depth(
-                list1, list2
-            )
+            partial(self._schedule_selection, self._show_dep_am)
         )
         self.max_depth_list.itemSelectionChanged.connect(
-            lambda list1=self.max_depth_list, list2=self.avg_depth_list: self.show_depth(
-                list1, list2
-            )
+            partial(self._schedule_selection, self._show_dep_ma)
         )
         self.avg_hydropathy_list.itemSelectionChanged.connect(
-            lambda list1=self.avg_hydropathy_list: self.show_hydropathy(list1)
+            partial(self._schedule_selection, self._show_hyd)
         )
         self.residues_list.itemSelectionChanged.connect(self.show_residues)
         self.default_view.toggled.connect(self.show_default_view)
@@ -335,39 +524,82 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         """
         Get detection parameters and molecular structures defined on the GUI and submit a job to KVFinder-web service.
 
-        The job submission is handled by QtNetwork package, part of PyQt6, that uses a POST method to send a JSON with data to KVFinder-web service.
+        The molecular structures are saved from PyMOL in the GUI thread. Then, the job is created by a _JobLoader runnable in a QThreadPool, that reads the molecular structures outside of the GUI thread, and submitted by _post_job method.
         """
-        from PyQt6 import QtNetwork
-        from PyQt6.QtCore import QJsonDocument, QUrl
-
-        # Create job
+        # Create job parameters
         parameters = self.create_parameters()
-        if type(parameters) is dict:
-            self.job = Job(parameters)
-        else:
+        if type(parameters) is not dict:
             return
 
         print("\n[==> Submitting job to KVFinder-web service ...")
 
+        # Save molecular structures, since PyMOL is only called from the GUI thread
+        try:
+            _save_pdbs(parameters["files"])
+        except Exception as e:
+            print("Error occurred: ", e)
+            return
+
+        # Create job in a thread pool
+        self.button_run.setEnabled(False)
+        self._job_loader = _JobLoader(parameters)
+        self._job_loader.signals.finished.connect(self._post_job)
+        self._job_loader.signals.error.connect(self._handle_job_error)
+        QtCore.QThreadPool.globalInstance().start(self._job_loader)
+
+    @QtCore.pyqtSlot(object)
+    def _post_job(self, job: Job) -> None:
+        """
+        PyQt Slot that submits a job to KVFinder-web service.
+
+        The job submission is handled by QtNetwork package, part of PyQt6, that uses a POST method to send a JSON with data to KVFinder-web service.
+
+        Parameters
+        ----------
+        job: Job
+            A Job object created by a _JobLoader runnable
+        """
+        # Enable button
+        self.button_run.setEnabled(True)
+        self._job_loader = None
+
+        # Save job
+        self.job = job
+
         # Post request
         try:
             # Prepare request
-            url = QUrl(f"{self.server}/create")
-            request = QtNetwork.QNetworkRequest(url)
-            request.setHeader(
-                QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader,
-                "application/json",
-            )
+            request = QtNetwork.QNetworkRequest(self.create_request)
 
             # Prepare data
-            data = QJsonDocument(self.job.input)
+            data = self.job.payload
+            request.setHeader(
+                QtNetwork.QNetworkRequest.KnownHeaders.ContentLengthHeader,
+                data.size(),
+            )
 
             # Post requests
-            self.reply = self.network_manager.post(request, data.toJson())
+            self.reply = self.network_manager.post(request, data)
             self.reply.finished.connect(self._handle_post_response)
         except Exception as e:
             print(e)
 
+    @QtCore.pyqtSlot(str)
+    def _handle_job_error(self, error: str) -> None:
+        """
+        PyQt Slot that handles an error raised while a _JobLoader runnable creates a job.
+
+        Parameters
+        ----------
+        error: str
+            Error message
+        """
+        # Enable button
+        self.button_run.setEnabled(True)
+        self._job_loader = None
+
+        print("Error occurred: ", error)
+
     def _handle_post_response(self) -> None:
         """
         This methods handles the POST method response.
@@ -375,16 +607,15 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         If there are no error in the request, this methods evaluates the response and process accordingly, by writing incoming results and job information to files.
 
         If there are an error in the request, this method displays a QMessageBox with the corresponding error message and HTTP error code.
-        """
-        from PyQt6 import QtNetwork
 
+        Job submission messages are reused between responses and opened without blocking the event loop.
+        """
         # Get QNetworkReply error status
         er = self.reply.error()
 
         # Handle Post Response
         if er == QtNetwork.QNetworkReply.NetworkError.NoError:
-            reply = str(self.reply.readAll(), "utf-8")
-            reply = json.loads(reply)
+            reply = _json.loads(self.reply.readAll().data())
 
             # Save job id
             self.job.id = reply["id"]
@@ -395,10 +626,10 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                     print("> Job successfully submitted to KVFinder-web service!")
 
                 # Message to user
-                message = Message(
+                self._msg_info.set_values(
                     "Job successfully submitted to KVFinder-web service!", self.job.id
                 )
-                message.exec()
+                self._msg_info.open()
 
                 # Save job file
                 self.job.status = "queued"
@@ -406,8 +637,9 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                 print(f"> Job ID: {self.job.id}")
 
                 # Add Job ID to Results tab
-                self.available_jobs.clear()
-                self.available_jobs.addItems(_get_jobs())
+                if self.job.id not in self._known_jobs:
+                    self._known_jobs.add(self.job.id)
+                    self.available_jobs.addItem(self.job.id)
                 self.available_jobs.setCurrentText(self.job.id)
 
             # Job already sent to KVFinder-web service
@@ -420,12 +652,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                         print("> Job already completed in KVFinder-web service!")
 
                     # Message to user
-                    message = Message(
+                    self._msg_info.set_values(
                         "Job already completed in KVFinder-web service!\nDisplaying results ...",
                         self.job.id,
                         status,
                     )
-                    message.exec()
+                    self._msg_info.open()
 
                     # Export results
                     self.job.output = reply
@@ -439,10 +671,8 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                     self.job.save(self.job.id)
 
                     # Add Job ID to Results tab
-                    if self.job.id not in [
-                        self.available_jobs.itemText(i)
-                        for i in range(self.available_jobs.count())
-                    ]:
+                    if self.job.id not in self._known_jobs:
+                        self._known_jobs.add(self.job.id)
                         self.available_jobs.addItem(self.job.id)
                     self.available_jobs.setCurrentText(self.job.id)
 
@@ -458,16 +688,14 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                         print("> Job already submitted to KVFinder-web service!")
 
                     # Message to user
-                    message = Message(
+                    self._msg_info.set_values(
                         "Job already submitted to KVFinder-web service!",
                         self.job.id,
                         status,
                     )
-                    message.exec()
+                    self._msg_info.open()
 
         elif er == QtNetwork.QNetworkReply.NetworkError.ConnectionRefusedError:
-            from PyQt6 import QtWidgets
-
             # Set server status in GUI
             self.server_down()
 
@@ -476,15 +704,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                 print(
                     "\n\033[93mWarning:\033[0m KVFinder-web service is Offline! Try again later!\n"
                 )
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Job Submission",
-                "KVFinder-web service is Offline!\n\nTry again later!",
+            self._msg_critical.setText(
+                "KVFinder-web service is Offline!\n\nTry again later!"
             )
+            self._msg_critical.exec()
 
         elif er == QtNetwork.QNetworkReply.NetworkError.UnknownContentError:
-            from PyQt6 import QtWidgets
-
             # Set server status in GUI
             self.server_up()
 
@@ -493,15 +718,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                 print(
                     f"\n\033[91mError:\033[0mJob exceedes the maximum payload of {data_limit} on KVFinder-web service!\n"
                 )
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Job Submission",
-                f"Job exceedes the maximum payload of {data_limit} on KVFinder-web service!",
+            self._msg_critical.setText(
+                f"Job exceedes the maximum payload of {data_limit} on KVFinder-web service!"
             )
+            self._msg_critical.exec()
 
         elif er == QtNetwork.QNetworkReply.NetworkError.TimeoutError:
-            from PyQt6 import QtWidgets
-
             # Set server status in GUI
             self.server_down()
 
@@ -510,24 +732,26 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                 print(
                     "\n\033[93mWarning:\033[0m The connection to the KVFinder-web server timed out!\n"
                 )
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Job Submission",
-                "The connection to the KVFinder-web server timed out!\n\nCheck your connection and KVFinder-web server status!",
+            self._msg_critical.setText(
+                "The connection to the KVFinder-web server timed out!\n\nCheck your connection and KVFinder-web server status!"
             )
+            self._msg_critical.exec()
 
         else:
             reply = str(self.reply.readAll(), "utf-8")
             # Message to user
             if verbosity in [1, 3]:
                 print(f"\n\033[91mError {er}\033[0m\n\n")
-            message = Message(
+            self._msg_error.set_values(
                 f"Error {er}!",
                 job_id=None,
                 status=None,
                 notification=f"{self.reply.errorString()}\n{reply}\n",
             )
-            message.exec()
+            self._msg_error.open()
+
+        # Release reply, keeping its connection pooled by the network manager
+        self.reply.deleteLater()
 
     def show_grid(self) -> None:
         """
@@ -537,40 +761,25 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         If there are an error, a QMessageBox will be displayed.
         """
-        from pymol import cmd
-        from PyQt6 import QtWidgets
-
-        global x, y, z
-
         if self.input.count() > 0:
             # Get minimum and maximum dimensions of target PDB
             pdb = self.input.currentText()
-            ([min_x, min_y, min_z], [max_x, max_y, max_z]) = cmd.get_extent(pdb)
+            mins, maxs = np.array(cmd.get_extent(pdb))
 
             # Get Probe Out value
-            probe_out = self.probe_out.value()
-            probe_out = round(probe_out - round(probe_out, 4) % round(0.6, 4), 1)
+            probe_out = _GRID_STEP * floor(self.probe_out.value() / _GRID_STEP)
 
             # Prepare dimensions
-            min_x = round(min_x - (min_x % 0.6), 1) - probe_out
-            min_y = round(min_y - (min_y % 0.6), 1) - probe_out
-            min_z = round(min_z - (min_z % 0.6), 1) - probe_out
-            max_x = round(max_x - (max_x % 0.6) + 0.6, 1) + probe_out
-            max_y = round(max_y - (max_y % 0.6) + 0.6, 1) + probe_out
-            max_z = round(max_z - (max_z % 0.6) + 0.6, 1) + probe_out
-
-            # Get center of each dimension (x, y, z)
-            x = (min_x + max_x) / 2
-            y = (min_y + max_y) / 2
-            z = (min_z + max_z) / 2
+            mins = _GRID_STEP * np.floor(mins / _GRID_STEP) - probe_out
+            maxs = _GRID_STEP * (np.floor(maxs / _GRID_STEP) + 1) + probe_out
 
             # Draw Grid
-            self.draw_grid(min_x, max_x, min_y, max_y, min_z, max_z)
+            self.draw_grid(mins, maxs)
         else:
             QtWidgets.QMessageBox.critical(self, "Error", "Select an input PDB!")
             return
 
-    def draw_grid(self, min_x, max_x, min_y, max_y, min_z, max_z) -> None:
+    def draw_grid(self, mins, maxs) -> None:
         """
         Draw Grid in PyMOL.
 
@@ -578,215 +787,37 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         Parameters
         ----------
-        min_x: float
-            Minimum X coordinate.
-        max_x: float
-            Maximum X coordinate.
-        min_y: float
-            Minimum Y coordinate.
-        max_y: float
-            Maximum Y coordinate.
-        min_z: float
-            Minimum Z coordinate.
-        max_z: float
-            Maximum Z coordinate.
-        """
-        from math import cos, sin
-
-        from pymol import cmd
-
+        mins: numpy.ndarray
+            Minimum X, Y and Z coordinates.
+        maxs: numpy.ndarray
+            Maximum X, Y and Z coordinates.
+        """
         # Prepare dimensions
-        angle1 = 0.0
-        angle2 = 0.0
-        min_x = x - min_x
-        max_x = max_x - x
-        min_y = y - min_y
-        max_y = max_y - y
-        min_z = z - min_z
-        max_z = max_z - z
-
-        # Get positions of grid vertices
-        # P1
-        x1 = (
-            -min_x * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y1 = -min_y * cos(angle1) + (-min_z) * sin(angle1) + y
-
-        z1 = (
-            min_x * sin(angle2)
-            + min_y * sin(angle1) * cos(angle2)
-            - min_z * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P2
-        x2 = (
-            max_x * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y2 = (-min_y) * cos(angle1) + (-min_z) * sin(angle1) + y
-
-        z2 = (
-            (-max_x) * sin(angle2)
-            - (-min_y) * sin(angle1) * cos(angle2)
-            + (-min_z) * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P3
-        x3 = (
-            (-min_x) * cos(angle2)
-            - max_y * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y3 = max_y * cos(angle1) + (-min_z) * sin(angle1) + y
-
-        z3 = (
-            -(-min_x) * sin(angle2)
-            - max_y * sin(angle1) * cos(angle2)
-            + (-min_z) * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P4
-        x4 = (
-            (-min_x) * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + max_z * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y4 = (-min_y) * cos(angle1) + max_z * sin(angle1) + y
-
-        z4 = (
-            -(-min_x) * sin(angle2)
-            - (-min_y) * sin(angle1) * cos(angle2)
-            + max_z * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P5
-        x5 = (
-            max_x * cos(angle2)
-            - max_y * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y5 = max_y * cos(angle1) + (-min_z) * sin(angle1) + y
-
-        z5 = (
-            (-max_x) * sin(angle2)
-            - max_y * sin(angle1) * cos(angle2)
-            + (-min_z) * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P6
-        x6 = (
-            max_x * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + max_z * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y6 = (-min_y) * cos(angle1) + max_z * sin(angle1) + y
-
-        z6 = (
-            (-max_x) * sin(angle2)
-            - (-min_y) * sin(angle1) * cos(angle2)
-            + max_z * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P7
-        x7 = (
-            (-min_x) * cos(angle2)
-            - max_y * sin(angle1) * sin(angle2)
-            + max_z * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y7 = max_y * cos(angle1) + max_z * sin(angle1) + y
-
-        z7 = (
-            -(-min_x) * sin(angle2)
-            - max_y * sin(angle1) * cos(angle2)
-            + max_z * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # P8
-        x8 = (
-            max_x * cos(angle2)
-            - max_y * sin(angle1) * sin(angle2)
-            + max_z * cos(angle1) * sin(angle2)
-            + x
-        )
-
-        y8 = max_y * cos(angle1) + max_z * sin(angle1) + y
-
-        z8 = (
-            (-max_x) * sin(angle2)
-            - max_y * sin(angle1) * cos(angle2)
-            + max_z * cos(angle1) * cos(angle2)
-            + z
-        )
-
-        # Create box object
+        min_x, min_y, min_z = mins.tolist()
+        max_x, max_y, max_z = maxs.tolist()
+
+        # Get positions of grid vertices (P1, ..., P8), since the grid is not rotated
+        vertices = [
+            [min_x, min_y, min_z],
+            [max_x, min_y, min_z],
+            [min_x, max_y, min_z],
+            [min_x, min_y, max_z],
+            [max_x, max_y, min_z],
+            [max_x, min_y, max_z],
+            [min_x, max_y, max_z],
+            [max_x, max_y, max_z],
+        ]
+
+        # Connect vertices with lines
+        cgo = [BEGIN, LINES, COLOR, 1.0, 1.0, 1.0]
+        for i, j in _BOX_EDGES:
+            cgo.extend([VERTEX, *vertices[i], VERTEX, *vertices[j]])
+        cgo.append(END)
+
+        # Create grid object
         if "grid" in cmd.get_names("objects"):
             cmd.delete("grid")
-
-        # Create vertices
-        cmd.pseudoatom("grid", name="v2", pos=[x2, y2, z2], color="white")
-        cmd.pseudoatom("grid", name="v3", pos=[x3, y3, z3], color="white")
-        cmd.pseudoatom("grid", name="v4", pos=[x4, y4, z4], color="white")
-        cmd.pseudoatom("grid", name="v5", pos=[x5, y5, z5], color="white")
-        cmd.pseudoatom("grid", name="v6", pos=[x6, y6, z6], color="white")
-        cmd.pseudoatom("grid", name="v7", pos=[x7, y7, z7], color="white")
-        cmd.pseudoatom("grid", name="v8", pos=[x8, y8, z8], color="white")
-
-        # Connect vertices
-        cmd.select("vertices", "(name v3,v7)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v2,v6)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v5,v8)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v2,v5)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v4,v6)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v4,v7)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v3,v5)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v6,v8)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v7,v8)")
-        cmd.bond("vertices", "vertices")
-        cmd.pseudoatom("grid", name="v1x", pos=[x1, y1, z1], color="white")
-        cmd.pseudoatom("grid", name="v2x", pos=[x2, y2, z2], color="white")
-        cmd.select("vertices", "(name v1x,v2x)")
-        cmd.bond("vertices", "vertices")
-        cmd.pseudoatom("grid", name="v1y", pos=[x1, y1, z1], color="white")
-        cmd.pseudoatom("grid", name="v3y", pos=[x3, y3, z3], color="white")
-        cmd.select("vertices", "(name v1y,v3y)")
-        cmd.bond("vertices", "vertices")
-        cmd.pseudoatom("grid", name="v4z", pos=[x4, y4, z4], color="white")
-        cmd.pseudoatom("grid", name="v1z", pos=[x1, y1, z1], color="white")
-        cmd.select("vertices", "(name v1z,v4z)")
-        cmd.bond("vertices", "vertices")
-        cmd.delete("vertices")
+        cmd.load_cgo(cgo, "grid")
 
     def restore(self, is_startup=False) -> None:
         """
@@ -799,9 +830,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         is_startup: bool
             Whether the GUI is starting up.
         """
-        from pymol import cmd
-        from PyQt6 import QtWidgets
-
         # Restore Results Tab
         if not is_startup:
             reply = QtWidgets.QMessageBox(self)
@@ -868,20 +896,22 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         combo_box: QComboBox
             A target QComboBox to add the object names that are on PyMOL scene
         """
-        from pymol import cmd
+        get_type = cmd.get_type
 
+        # Get molecules loaded on PyMOL scene, except objects created by the plugin
+        molecules = [
+            item
+            for item in cmd.get_names("all")
+            if get_type(item) == "object:molecule"
+            and item not in _PLUGIN_OBJECTS
+            and not item.endswith(".KVFinder.output")
+        ]
+
+        # Fill combo box in one model update, without emitting a signal per item
+        combo_box.blockSignals(True)
         combo_box.clear()
-        for item in cmd.get_names("all"):
-            if (
-                cmd.get_type(item) == "object:molecule"
-                and item != "box"
-                and item != "grid"
-                and item != "cavities"
-                and item != "residues"
-                and item[-16:] != ".KVFinder.output"
-                and item != "target_exclusive"
-            ):
-                combo_box.addItem(item)
+        combo_box.addItems(molecules)
+        combo_box.blockSignals(False)
 
         return
 
@@ -889,18 +919,24 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         """
         Callback for the "Browse ..." button.
 
-        This method opens a QFileDialog to select a directory.
+        This method opens a QFileDialog to select a directory, that sets the selected directory when accepted.
         """
-        from PyQt6 import QtCore, QtWidgets
 
-        fname = QtWidgets.QFileDialog.getExistingDirectory(
-            caption="Choose Output Directory", directory=os.getcwd()
-        )
+        # Set selected directory, that QFileDialog only returns if it exists
+        def _set_directory(fname: str) -> None:
+            if _NEEDS_NATIVE_SEP:
+                fname = QtCore.QDir.toNativeSeparators(fname)
+            self.output_dir_path.setText(fname)
 
-        if fname:
-            fname = QtCore.QDir.toNativeSeparators(fname)
-            if os.path.isdir(fname):
-                self.output_dir_path.setText(fname)
+        # Open dialog without blocking the event loop
+        file_dialog = QtWidgets.QFileDialog(
+            self, "Choose Output Directory", os.getcwd()
+        )
+        file_dialog.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        file_dialog.setFileMode(QtWidgets.QFileDialog.FileMode.Directory)
+        file_dialog.setOption(QtWidgets.QFileDialog.Option.ShowDirsOnly)
+        file_dialog.fileSelected.connect(_set_directory)
+        file_dialog.open()
 
         return
 
@@ -910,58 +946,58 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         It gets the minimum and maximum coordinates of the current selection 'sele'. With that, it calculates the center, minimum and maximum coordinates and rotation angles of the box. Afterwards, enable the components of Box adjusment frame and set their values.
         """
-        from pymol import cmd
+        # Get PyMOL objects and selections
+        names = set(cmd.get_names("selections"))
 
         # Delete Box object in PyMOL
-        if "box" in cmd.get_names("selections"):
+        if "box" in names:
             cmd.delete("box")
         # Get dimensions of selected residues
         selection = "sele"
-        if selection in cmd.get_names("selections"):
-            ([min_x, min_y, min_z], [max_x, max_y, max_z]) = cmd.get_extent(selection)
+        if selection in names:
+            mins, maxs = np.array(cmd.get_extent(selection))
         else:
-            ([min_x, min_y, min_z], [max_x, max_y, max_z]) = cmd.get_extent("")
+            mins, maxs = np.array(cmd.get_extent(""))
 
         # Get center of each dimension (x, y, z)
-        self.x = (min_x + max_x) / 2
-        self.y = (min_y + max_y) / 2
-        self.z = (min_z + max_z) / 2
-
-        # Set Box variables in interface
-        self.min_x.setValue(round(self.x - (min_x - self.padding.value()), 1))
-        self.max_x.setValue(round((max_x + self.padding.value()) - self.x, 1))
-        self.min_y.setValue(round(self.y - (min_y - self.padding.value()), 1))
-        self.max_y.setValue(round((max_y + self.padding.value()) - self.y, 1))
-        self.min_z.setValue(round(self.z - (min_z - self.padding.value()), 1))
-        self.max_z.setValue(round((max_z + self.padding.value()) - self.z, 1))
-        self.angle1.setValue(0)
-        self.angle2.setValue(0)
+        center = (mins + maxs) / 2
+        self.x, self.y, self.z = center.tolist()
+
+        # Get distances of padded box faces from the center of the box
+        padding = self.padding.value()
+        lows = (center - (mins - padding)).tolist()
+        highs = ((maxs + padding) - center).tolist()
+
+        # Set Box variables in interface (spin boxes round values to their decimals)
+        for name in self._BOX_SPINS:
+            getattr(self, name).blockSignals(True)
+        try:
+            for axis, low, high in zip("xyz", lows, highs):
+                getattr(self, f"min_{axis}").setValue(low)
+                getattr(self, f"max_{axis}").setValue(high)
+            self.angle1.setValue(0)
+            self.angle2.setValue(0)
+        finally:
+            for name in self._BOX_SPINS:
+                getattr(self, name).blockSignals(False)
 
         # Setting background box values
-        self.min_x_set = self.min_x.value()
-        self.max_x_set = self.max_x.value()
-        self.min_y_set = self.min_y.value()
-        self.max_y_set = self.max_y.value()
-        self.min_z_set = self.min_z.value()
-        self.max_z_set = self.max_z.value()
-        self.angle1_set = self.angle1.value()
-        self.angle2_set = self.angle2.value()
-        self.padding_set = self.padding.value()
+        for name in self._BOX_SPINS:
+            setattr(self, f"{name}_set", getattr(self, name).value())
+        self.padding_set = padding
 
         # Draw box
         self.draw_box()
 
         # Enable/Disable buttons
-        self.button_draw_box.setEnabled(False)
-        self.button_redraw_box.setEnabled(True)
-        self.min_x.setEnabled(True)
-        self.min_y.setEnabled(True)
-        self.min_z.setEnabled(True)
-        self.max_x.setEnabled(True)
-        self.max_y.setEnabled(True)
-        self.max_z.setEnabled(True)
-        self.angle1.setEnabled(True)
-        self.angle2.setEnabled(True)
+        self.setUpdatesEnabled(False)
+        try:
+            self.button_draw_box.setEnabled(False)
+            self.button_redraw_box.setEnabled(True)
+            for name in self._BOX_SPINS:
+                getattr(self, name).setEnabled(True)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def draw_box(self) -> None:
         """
@@ -969,250 +1005,65 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         This method calculates each vertice of the custom box. Then, it draws and connects them on the PyMOL viewer as a object named 'box'.
         """
-        from math import cos, pi, sin
-
-        import pymol
-        from pymol import cmd
-
-        # Convert angle
-        angle1 = (self.angle1.value() / 180.0) * pi
-        angle2 = (self.angle2.value() / 180.0) * pi
-
-        # Get positions of box vertices
-        # P1
-        x1 = (
-            -self.min_x.value() * cos(angle2)
-            - (-self.min_y.value()) * sin(angle1) * sin(angle2)
-            + (-self.min_z.value()) * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y1 = (
-            -self.min_y.value() * cos(angle1)
-            + (-self.min_z.value()) * sin(angle1)
-            + self.y
-        )
-
-        z1 = (
-            self.min_x.value() * sin(angle2)
-            + self.min_y.value() * sin(angle1) * cos(angle2)
-            - self.min_z.value() * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P2
-        x2 = (
-            self.max_x.value() * cos(angle2)
-            - (-self.min_y.value()) * sin(angle1) * sin(angle2)
-            + (-self.min_z.value()) * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y2 = (
-            (-self.min_y.value()) * cos(angle1)
-            + (-self.min_z.value()) * sin(angle1)
-            + self.y
-        )
-
-        z2 = (
-            (-self.max_x.value()) * sin(angle2)
-            - (-self.min_y.value()) * sin(angle1) * cos(angle2)
-            + (-self.min_z.value()) * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P3
-        x3 = (
-            (-self.min_x.value()) * cos(angle2)
-            - self.max_y.value() * sin(angle1) * sin(angle2)
-            + (-self.min_z.value()) * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y3 = (
-            self.max_y.value() * cos(angle1)
-            + (-self.min_z.value()) * sin(angle1)
-            + self.y
-        )
-
-        z3 = (
-            -(-self.min_x.value()) * sin(angle2)
-            - self.max_y.value() * sin(angle1) * cos(angle2)
-            + (-self.min_z.value()) * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P4
-        x4 = (
-            (-self.min_x.value()) * cos(angle2)
-            - (-self.min_y.value()) * sin(angle1) * sin(angle2)
-            + self.max_z.value() * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y4 = (
-            (-self.min_y.value()) * cos(angle1)
-            + self.max_z.value() * sin(angle1)
-            + self.y
-        )
-
-        z4 = (
-            -(-self.min_x.value()) * sin(angle2)
-            - (-self.min_y.value()) * sin(angle1) * cos(angle2)
-            + self.max_z.value() * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P5
-        x5 = (
-            self.max_x.value() * cos(angle2)
-            - self.max_y.value() * sin(angle1) * sin(angle2)
-            + (-self.min_z.value()) * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y5 = (
-            self.max_y.value() * cos(angle1)
-            + (-self.min_z.value()) * sin(angle1)
-            + self.y
-        )
-
-        z5 = (
-            (-self.max_x.value()) * sin(angle2)
-            - self.max_y.value() * sin(angle1) * cos(angle2)
-            + (-self.min_z.value()) * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P6
-        x6 = (
-            self.max_x.value() * cos(angle2)
-            - (-self.min_y.value()) * sin(angle1) * sin(angle2)
-            + self.max_z.value() * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y6 = (
-            (-self.min_y.value()) * cos(angle1)
-            + self.max_z.value() * sin(angle1)
-            + self.y
-        )
-
-        z6 = (
-            (-self.max_x.value()) * sin(angle2)
-            - (-self.min_y.value()) * sin(angle1) * cos(angle2)
-            + self.max_z.value() * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P7
-        x7 = (
-            (-self.min_x.value()) * cos(angle2)
-            - self.max_y.value() * sin(angle1) * sin(angle2)
-            + self.max_z.value() * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y7 = (
-            self.max_y.value() * cos(angle1) + self.max_z.value() * sin(angle1) + self.y
+        # Get rotation matrix of box angles
+        rotation = _get_rotation_matrix(
+            (self.angle1.value() / 180.0) * pi, (self.angle2.value() / 180.0) * pi
         )
 
-        z7 = (
-            -(-self.min_x.value()) * sin(angle2)
-            - self.max_y.value() * sin(angle1) * cos(angle2)
-            + self.max_z.value() * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P8
-        x8 = (
-            self.max_x.value() * cos(angle2)
-            - self.max_y.value() * sin(angle1) * sin(angle2)
-            + self.max_z.value() * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y8 = (
-            self.max_y.value() * cos(angle1) + self.max_z.value() * sin(angle1) + self.y
-        )
+        # Get distances of box faces from the center of the box
+        mins = np.array([self.min_x.value(), self.min_y.value(), self.min_z.value()])
+        maxs = np.array([self.max_x.value(), self.max_y.value(), self.max_z.value()])
 
-        z8 = (
-            (-self.max_x.value()) * sin(angle2)
-            - self.max_y.value() * sin(angle1) * cos(angle2)
-            + self.max_z.value() * cos(angle1) * cos(angle2)
-            + self.z
-        )
+        # Get positions of box vertices
+        vertices = self._get_box_vertices(
+            mins, maxs, rotation, [self.x, self.y, self.z]
+        ).tolist()
+
+        # Define colors of box vertices once, keeping colors of a box left on PyMOL viewer
+        if not self._box_colors_defined:
+            if "box" in cmd.get_names("selections"):
+                model = cmd.get_model("box")
+                list_color = [(at.name, at.color_code) for at in model.atom]
+            else:
+                list_color = []
+            if len(list_color) > 0:
+                for item in list_color:
+                    at_name = item[0]
+                    at_c = item[1]
+                    cmd.set_color(at_name + "color", cmd.get_color_tuple(at_c))
+            else:
+                for color_name in _BOX_COLOR_NAMES:
+                    cmd.set_color(color_name, [0.86, 0.86, 0.86])
+            self._box_colors_defined = True
+
+        # Move vertices of an existing box in place, keeping its atoms and bonds
+        if self._box_created and "box" in cmd.get_names("objects"):
+            coords = {f"v{i + 1}": vertices[i] for i in range(1, 8)}
+            for axis, j in (("x", 1), ("y", 2), ("z", 3)):
+                coords[f"v1{axis}"] = vertices[0]
+                coords[f"v{j + 1}{axis}"] = vertices[j]
+            cmd.alter_state(
+                1, "box", "(x, y, z) = coords[name]", space={"coords": coords}
+            )
+            return
 
         # Create box object
-        pymol.stored.list = []
-        if "box" in cmd.get_names("selections"):
-            cmd.iterate("box", "stored.list.append((name, color))", quiet=1)
-        list_color = pymol.stored.list
         cmd.delete("box")
-        if len(list_color) > 0:
-            for item in list_color:
-                at_name = item[0]
-                at_c = item[1]
-                cmd.set_color(at_name + "color", cmd.get_color_tuple(at_c))
-        else:
-            for at_name in [
-                "v2",
-                "v3",
-                "v4",
-                "v5",
-                "v6",
-                "v7",
-                "v8",
-                "v1x",
-                "v1y",
-                "v1z",
-                "v2x",
-                "v3y",
-                "v4z",
-            ]:
-                cmd.set_color(at_name + "color", [0.86, 0.86, 0.86])
 
         # Create vertices
-        cmd.pseudoatom("box", name="v2", pos=[x2, y2, z2], color="v2color")
-        cmd.pseudoatom("box", name="v3", pos=[x3, y3, z3], color="v3color")
-        cmd.pseudoatom("box", name="v4", pos=[x4, y4, z4], color="v4color")
-        cmd.pseudoatom("box", name="v5", pos=[x5, y5, z5], color="v5color")
-        cmd.pseudoatom("box", name="v6", pos=[x6, y6, z6], color="v6color")
-        cmd.pseudoatom("box", name="v7", pos=[x7, y7, z7], color="v7color")
-        cmd.pseudoatom("box", name="v8", pos=[x8, y8, z8], color="v8color")
-
-        # Connect vertices
-        cmd.select("vertices", "(name v3,v7)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v2,v6)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v5,v8)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v2,v5)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v4,v6)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v4,v7)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v3,v5)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v6,v8)")
-        cmd.bond("vertices", "vertices")
-        cmd.select("vertices", "(name v7,v8)")
-        cmd.bond("vertices", "vertices")
-        cmd.pseudoatom("box", name="v1x", pos=[x1, y1, z1], color="red")
-        cmd.pseudoatom("box", name="v2x", pos=[x2, y2, z2], color="red")
-        cmd.select("vertices", "(name v1x,v2x)")
-        cmd.bond("vertices", "vertices")
-        cmd.pseudoatom("box", name="v1y", pos=[x1, y1, z1], color="forest")
-        cmd.pseudoatom("box", name="v3y", pos=[x3, y3, z3], color="forest")
-        cmd.select("vertices", "(name v1y,v3y)")
-        cmd.bond("vertices", "vertices")
-        cmd.pseudoatom("box", name="v4z", pos=[x4, y4, z4], color="blue")
-        cmd.pseudoatom("box", name="v1z", pos=[x1, y1, z1], color="blue")
-        cmd.select("vertices", "(name v1z,v4z)")
-        cmd.bond("vertices", "vertices")
-        cmd.delete("vertices")
+        for name, color, pos in zip(_BOX_ATOM_NAMES, _BOX_COLOR_NAMES, vertices[1:]):
+            cmd.pseudoatom("box", name=name, pos=pos, color=color)
+
+        # Connect vertices (the edges of P1 are drawn as axes)
+        for i, j in _BOX_EDGES[:9]:
+            cmd.bond(f"box and name v{i + 1}", f"box and name v{j + 1}")
+
+        # Create and connect vertices of X, Y and Z axes
+        for axis, j, color in (("x", 1, "red"), ("y", 2, "forest"), ("z", 3, "blue")):
+            cmd.pseudoatom("box", name=f"v1{axis}", pos=vertices[0], color=color)
+            cmd.pseudoatom("box", name=f"v{j + 1}{axis}", pos=vertices[j], color=color)
+            cmd.bond(f"box and name v1{axis}", f"box and name v{j + 1}{axis}")
+        self._box_created = True
 
     def delete_box(self) -> None:
         """
@@ -1220,8 +1071,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         Deletes box object on PyMOL viewer, disables 'Delete Box' and 'Redraw Box' buttons, enables 'Draw Box' button and set box variables to default values (class Default).
         """
-        from pymol import cmd
-
         # Reset all box variables
         self.x = 0
         self.y = 0
@@ -1230,28 +1079,22 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         # Delete Box and Vertices objects in PyMOL
         cmd.delete("vertices")
         cmd.delete("box")
+        self._box_colors_defined = False
+        self._box_created = False
 
-        # Set Box variables in the interface
-        self.min_x.setValue(self._default.min_x)
-        self.max_x.setValue(self._default.max_x)
-        self.min_y.setValue(self._default.min_y)
-        self.max_y.setValue(self._default.max_y)
-        self.min_z.setValue(self._default.min_z)
-        self.max_z.setValue(self._default.max_z)
-        self.angle1.setValue(self._default.angle1)
-        self.angle2.setValue(self._default.angle2)
-
-        # Change state of buttons in the interface
-        self.button_draw_box.setEnabled(True)
-        self.button_redraw_box.setEnabled(False)
-        self.min_x.setEnabled(False)
-        self.min_y.setEnabled(False)
-        self.min_z.setEnabled(False)
-        self.max_x.setEnabled(False)
-        self.max_y.setEnabled(False)
-        self.max_z.setEnabled(False)
-        self.angle1.setEnabled(False)
-        self.angle2.setEnabled(False)
+        # Set Box variables and change state of buttons in the interface
+        self.setUpdatesEnabled(False)
+        try:
+            for name in self._BOX_SPINS:
+                spin_box = getattr(self, name)
+                spin_box.blockSignals(True)
+                spin_box.setValue(getattr(self._default, name))
+                spin_box.blockSignals(False)
+                spin_box.setEnabled(False)
+            self.button_draw_box.setEnabled(True)
+            self.button_redraw_box.setEnabled(False)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def redraw_box(self) -> None:
         """
@@ -1263,127 +1106,77 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         -------
         It is advisable to change one variable at a time to achieve the expected result.
         """
-        from pymol import cmd
+        # Get box variables displayed on the GUI
+        values = [getattr(self, name).value() for name in self._BOX_SPINS]
+        padding = self.padding.value()
+
+        # Check if box variables were altered on the GUI
+        altered = values != [getattr(self, f"{name}_set") for name in self._BOX_SPINS]
+        selection = "sele" in cmd.get_names("selections")
+
+        # Skip redrawing when neither box variables, padding nor selection changed the box
+        if (
+            not altered
+            and not selection
+            and padding == self.padding_set
+            and "box" in cmd.get_names("objects")
+        ):
+            return
+
+        # Box variables altered
+        if altered:
+            for name, value in zip(self._BOX_SPINS, values):
+                setattr(self, f"{name}_set", value)
 
-        # Provided a selection
-        if "sele" in cmd.get_names("selections"):
+        # Provided a selection: padding or selection altered
+        if selection and not altered:
             # Get dimensions of selected residues
-            ([min_x, min_y, min_z], [max_x, max_y, max_z]) = cmd.get_extent("sele")
-
-            if (
-                self.min_x.value() != self.min_x_set
-                or self.max_x.value() != self.max_x_set
-                or self.min_y.value() != self.min_y_set
-                or self.max_y.value() != self.max_y_set
-                or self.min_z.value() != self.min_z_set
-                or self.max_z.value() != self.max_z_set
-                or self.angle1.value() != self.angle1_set
-                or self.angle2.value() != self.angle2_set
-            ):
-                self.min_x_set = self.min_x.value()
-                self.max_x_set = self.max_x.value()
-                self.min_y_set = self.min_y.value()
-                self.max_y_set = self.max_y.value()
-                self.min_z_set = self.min_z.value()
-                self.max_z_set = self.max_z.value()
-                self.angle1_set = self.angle1.value()
-                self.angle2_set = self.angle2.value()
-            # Padding or selection altered
-            else:
-                # Get center of each dimension (x, y, z)
-                self.x = (min_x + max_x) / 2
-                self.y = (min_y + max_y) / 2
-                self.z = (min_z + max_z) / 2
-
-                # Set background box values
-                self.min_x_set = (
-                    round(self.x - (min_x - self.padding.value()), 1)
-                    + self.min_x.value()
-                    - self.min_x_set
-                )
-                self.max_x_set = (
-                    round((max_x + self.padding.value()) - self.x, 1)
-                    + self.max_x.value()
-                    - self.max_x_set
-                )
-                self.min_y_set = (
-                    round(self.y - (min_y - self.padding.value()), 1)
-                    + self.min_y.value()
-                    - self.min_y_set
-                )
-                self.max_y_set = (
-                    round((max_y + self.padding.value()) - self.y, 1)
-                    + self.max_y.value()
-                    - self.max_y_set
-                )
-                self.min_z_set = (
-                    round(self.z - (min_z - self.padding.value()), 1)
-                    + self.min_z.value()
-                    - self.min_z_set
-                )
-                self.max_z_set = (
-                    round((max_z + self.padding.value()) - self.z, 1)
-                    + self.max_z.value()
-                    - self.max_z_set
-                )
-                self.angle1_set = 0 + self.angle1.value()
-                self.angle2_set = 0 + self.angle2.value()
-                self.padding_set = self.padding.value()
-        # Not provided a selection
+            mins, maxs = np.array(cmd.get_extent("sele"))
+        # Not provided a selection: padding altered
+        elif not selection and self.padding_set != padding:
+            # Prepare dimensions without old padding
+            mins = self.padding_set - np.array(
+                [self.min_x_set, self.min_y_set, self.min_z_set]
+            )
+            maxs = (
+                np.array([self.max_x_set, self.max_y_set, self.max_z_set])
+                - self.padding_set
+            )
         else:
-            if (
-                self.min_x.value() != self.min_x_set
-                or self.max_x.value() != self.max_x_set
-                or self.min_y.value() != self.min_y_set
-                or self.max_y.value() != self.max_y_set
-                or self.min_z.value() != self.min_z_set
-                or self.max_z.value() != self.max_z_set
-                or self.angle1.value() != self.angle1_set
-                or self.angle2.value() != self.angle2_set
-            ):
-                self.min_x_set = self.min_x.value()
-                self.max_x_set = self.max_x.value()
-                self.min_y_set = self.min_y.value()
-                self.max_y_set = self.max_y.value()
-                self.min_z_set = self.min_z.value()
-                self.max_z_set = self.max_z.value()
-                self.angle1_set = self.angle1.value()
-                self.angle2_set = self.angle2.value()
-
-            if self.padding_set != self.padding.value():
-                # Prepare dimensions without old padding
-                min_x = self.padding_set - self.min_x_set
-                max_x = self.max_x_set - self.padding_set
-                min_y = self.padding_set - self.min_y_set
-                max_y = self.max_y_set - self.padding_set
-                min_z = self.padding_set - self.min_z_set
-                max_z = self.max_z_set - self.padding_set
-
-                # Get center of each dimension (x, y, z)
-                self.x = (min_x + max_x) / 2
-                self.y = (min_y + max_y) / 2
-                self.z = (min_z + max_z) / 2
-
-                # Set background box values
-                self.min_x_set = round(self.x - (min_x - self.padding.value()), 1)
-                self.max_x_set = round((max_x + self.padding.value()) - self.x, 1)
-                self.min_y_set = round(self.y - (min_y - self.padding.value()), 1)
-                self.max_y_set = round((max_y + self.padding.value()) - self.y, 1)
-                self.min_z_set = round(self.z - (min_z - self.padding.value()), 1)
-                self.max_z_set = round((max_z + self.padding.value()) - self.z, 1)
-                self.angle1_set = self.angle1.value()
-                self.angle2_set = self.angle2.value()
-                self.padding_set = self.padding.value()
+            mins = maxs = None
+
+        if mins is not None:
+            # Get center of each dimension (x, y, z)
+            center = (mins + maxs) / 2
+            self.x, self.y, self.z = center.tolist()
+
+            # Set background box values
+            lows = (center - (mins - padding)).tolist()
+            highs = ((maxs + padding) - center).tolist()
+            for axis, low, high in zip("xyz", lows, highs):
+                setattr(self, f"min_{axis}_set", low)
+                setattr(self, f"max_{axis}_set", high)
+            self.angle1_set = values[6]
+            self.angle2_set = values[7]
+            self.padding_set = padding
 
         # Set Box variables in the interface
-        self.min_x.setValue(self.min_x_set)
-        self.max_x.setValue(self.max_x_set)
-        self.min_y.setValue(self.min_y_set)
-        self.max_y.setValue(self.max_y_set)
-        self.min_z.setValue(self.min_z_set)
-        self.max_z.setValue(self.max_z_set)
-        self.angle1.setValue(self.angle1_set)
-        self.angle2.setValue(self.angle2_set)
+        for name in self._BOX_SPINS:
+            getattr(self, name).blockSignals(True)
+        try:
+            for name in self._BOX_SPINS:
+                getattr(self, name).setValue(getattr(self, f"{name}_set"))
+        finally:
+            for name in self._BOX_SPINS:
+                getattr(self, name).blockSignals(False)
+
+        # Set background box values rounded by spin boxes to their decimals
+        self.min_x_set = self.min_x.value()
+        self.max_x_set = self.max_x.value()
+        self.min_y_set = self.min_y.value()
+        self.max_y_set = self.max_y.value()
+        self.min_z_set = self.min_z.value()
+        self.max_z_set = self.max_z.value()
 
         # Redraw box
         self.draw_box()
@@ -1394,8 +1187,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         This method displays a help message to the user, explaining the variables shown on the Box adjustment frame.
         """
-        from PyQt6 import QtCore, QtWidgets
-
         text = QtCore.QCoreApplication.translate(
             "KVFinderWeb",
             '<html><head/><body><p align="justify"><span style=" font-weight:600; text-decoration: underline;">Box Adjustment mode:</span></p><p align="justify">- Create a selection (optional);</p><p align="justify">- Define a <span style=" font-weight:600;">Padding</span> (optional);</p><p align="justify">- Click on <span style=" font-weight:600;">Draw Box</span> button.</p><p align="justify"><br/><span style="text-decoration: underline;">Customize your <span style=" font-weight:600;">box</span></span>:</p><p align="justify">- Change one item at a time (e.g. <span style=" font-style:italic;">Padding</span>, <span style=" font-style:italic;">Minimum X</span>, <span style=" font-style:italic;">Maximum X</span>, ...);</p><p align="justify">- Click on <span style=" font-weight:600;">Redraw Box</span> button.<br/></p><p><span style=" font-weight:400; text-decoration: underline;">Delete </span><span style=" text-decoration: underline;">box</span><span style=" font-weight:400; text-decoration: underline;">:</span></p><p align="justify">- Click on <span style=" font-weight:600;">Delete Box</span> button.<br/></p><p align="justify"><span style="text-decoration: underline;">Colors of the <span style=" font-weight:600;">box</span> object:</span></p><p align="justify">- <span style=" font-weight:600;">Red</span> corresponds to <span style=" font-weight:600;">X</span> axis;</p><p align="justify">- <span style=" font-weight:600;">Green</span> corresponds to <span style=" font-weight:600;">Y</span> axis;</p><p align="justify">- <span style=" font-weight:600;">Blue</span> corresponds to <span style=" font-weight:600;">Z</span> axis.</p></body></html>',
@@ -1418,70 +1209,20 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         parameters: dict
             Python dictionary containing detection parameters and molecular structures names loaded in PyMOL
         """
-        # Create dict
-        parameters = dict()
-
-        # title
-        parameters["title"] = "KVFinder-web job file"
-
-        # status
-        parameters["status"] = "submitting"
-
-        # files
-        parameters["files"] = dict()
-        # pdb
-        if self.input.currentText() != "":
-            parameters["files"]["pdb"] = self.input.currentText()
-        else:
-            from PyQt6 import QtWidgets
-
+        # Check input PDB
+        if self.input.currentText() == "":
             QtWidgets.QMessageBox.critical(self, "Error", "Select an input PDB!")
             return False
-        # ligand
-        if self.ligand_adjustment.isChecked():
-            if self.ligand.currentText() != "":
-                parameters["files"]["ligand"] = self.ligand.currentText()
-            else:
-                from PyQt6 import QtWidgets
-
-                QtWidgets.QMessageBox.critical(self, "Error", "Select an ligand PDB!")
-                return False
-        # output
-        parameters["files"]["output"] = self.output_dir_path.text()
-        # base_name
-        parameters["files"]["base_name"] = self.base_name.text()
-
-        # modes
-        parameters["modes"] = dict()
-        # whole protein mode
-        parameters["modes"]["whole_protein_mode"] = not self.box_adjustment.isChecked()
-        # box adjustment mode
-        parameters["modes"]["box_mode"] = self.box_adjustment.isChecked()
-        # resolution_mode
-        parameters["modes"]["resolution_mode"] = "Low"
-        # surface_mode
-        parameters["modes"]["surface_mode"] = True
-        # kvp_mode
-        parameters["modes"]["kvp_mode"] = False
-        # ligand_mode
-        parameters["modes"]["ligand_mode"] = self.ligand_adjustment.isChecked()
-
-        # step_size
-        parameters["step_size"] = dict()
-        parameters["step_size"]["step_size"] = 0.0
-
-        # probes
-        parameters["probes"] = dict()
-        # probe_in
-        parameters["probes"]["probe_in"] = self.probe_in.value()
-        # probe_out
-        parameters["probes"]["probe_out"] = self.probe_out.value()
 
+        # Check ligand PDB
+        if self.ligand_adjustment.isChecked() and self.ligand.currentText() == "":
+            QtWidgets.QMessageBox.critical(self, "Error", "Select an ligand PDB!")
+            return False
+
+        # Check removal distance and volume cutoff
         if (self.volume_cutoff.value() == 0.0) and (
             self.removal_distance.value() == 0.0
         ):
-            from PyQt6 import QtWidgets
-
             QtWidgets.QMessageBox.critical(
                 self,
                 "Error",
@@ -1489,37 +1230,64 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             )
             return False
 
-        # cutoffs
-        parameters["cutoffs"] = dict()
-        # volume_cutoff
-        parameters["cutoffs"]["volume_cutoff"] = self.volume_cutoff.value()
-        # ligand_cutoff
-        parameters["cutoffs"]["ligand_cutoff"] = self.ligand_cutoff.value()
-        # removal_distance
-        parameters["cutoffs"]["removal_distance"] = self.removal_distance.value()
-
-        # visiblebox
-        box = self.create_box_parameters()
-        parameters["visiblebox"] = dict()
-        parameters["visiblebox"].update(box)
-
-        # internalbox
-        box = self.create_box_parameters(is_internal_box=True)
-        parameters["internalbox"] = dict()
-        parameters["internalbox"].update(box)
-
-        return parameters
-
-    def create_box_parameters(
-        self, is_internal_box=False
-    ) -> Dict[str, Dict[str, float]]:
-        """
-        Create custom box coordinates (P1, P2, P3 and P4) that limits the search space in the box adjustment mode.
+        # Rotation matrix shared by visiblebox and internalbox
+        if self.box_adjustment.isChecked():
+            rotation = _get_rotation_matrix(
+                (self.angle1_set / 180.0) * pi, (self.angle2_set / 180.0) * pi
+            )
+        else:
+            rotation = _get_rotation_matrix(0.0, 0.0)
+
+        # Create dict
+        parameters = {
+            "title": "KVFinder-web job file",
+            "status": "submitting",
+            "files": {
+                "pdb": self.input.currentText(),
+                **(
+                    {"ligand": self.ligand.currentText()}
+                    if self.ligand_adjustment.isChecked()
+                    else {}
+                ),
+                "output": self.output_dir_path.text(),
+                "base_name": self.base_name.text(),
+            },
+            "modes": {
+                "whole_protein_mode": not self.box_adjustment.isChecked(),
+                "box_mode": self.box_adjustment.isChecked(),
+                "resolution_mode": "Low",
+                "surface_mode": True,
+                "kvp_mode": False,
+                "ligand_mode": self.ligand_adjustment.isChecked(),
+            },
+            "step_size": {"step_size": 0.0},
+            "probes": {
+                "probe_in": self.probe_in.value(),
+                "probe_out": self.probe_out.value(),
+            },
+            "cutoffs": {
+                "volume_cutoff": self.volume_cutoff.value(),
+                "ligand_cutoff": self.ligand_cutoff.value(),
+                "removal_distance": self.removal_distance.value(),
+            },
+            "visiblebox": self.create_box_parameters(rotation),
+            "internalbox": self.create_box_parameters(rotation, is_internal_box=True),
+        }
+
+        return parameters
+
+    def create_box_parameters(
+        self, rotation, is_internal_box=False
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Create custom box coordinates (P1, P2, P3 and P4) that limits the search space in the box adjustment mode.
 
         parKVFinder software uses two sets of box to perform the cavity detection (a private box - called internal - and a visible box). The visible box is smaller than the private box by the contribution of the Probe Out size in each axis.
 
         Parameters
         ----------
+        rotation: numpy.ndarray
+            Rotation matrix of the custom box angles, computed once for both boxes
         is_internal_box: bool
             Whether the box coordinates being calculated are of the internal box (private box)
 
@@ -1528,118 +1296,60 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         box: dict
             A Python dictionary containing xyz coordinates for P1 (origin), P2 (X-axis), P3 (Y-axis) and P4 (Z-axis) of the internal or visible box
         """
-        from math import cos, pi, sin
-
         # Get box parameters
         if self.box_adjustment.isChecked():
-            min_x = self.min_x_set
-            max_x = self.max_x_set
-            min_y = self.min_y_set
-            max_y = self.max_y_set
-            min_z = self.min_z_set
-            max_z = self.max_z_set
-            angle1 = self.angle1_set
-            angle2 = self.angle2_set
+            mins = np.array([self.min_x_set, self.min_y_set, self.min_z_set])
+            maxs = np.array([self.max_x_set, self.max_y_set, self.max_z_set])
         else:
-            min_x = 0.0
-            max_x = 0.0
-            min_y = 0.0
-            max_y = 0.0
-            min_z = 0.0
-            max_z = 0.0
-            angle1 = 0.0
-            angle2 = 0.0
+            mins = np.zeros(3)
+            maxs = np.zeros(3)
 
         # Add probe_out to internal box
         if is_internal_box:
-            min_x += self.probe_out.value()
-            max_x += self.probe_out.value()
-            min_y += self.probe_out.value()
-            max_y += self.probe_out.value()
-            min_z += self.probe_out.value()
-            max_z += self.probe_out.value()
-
-        # Convert angle
-        angle1 = (angle1 / 180.0) * pi
-        angle2 = (angle2 / 180.0) * pi
-
-        # Get positions of box vertices
-        # P1
-        x1 = (
-            -min_x * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y1 = -min_y * cos(angle1) + (-min_z) * sin(angle1) + self.y
-
-        z1 = (
-            min_x * sin(angle2)
-            + min_y * sin(angle1) * cos(angle2)
-            - min_z * cos(angle1) * cos(angle2)
-            + self.z
-        )
-
-        # P2
-        x2 = (
-            max_x * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + self.x
-        )
-
-        y2 = (-min_y) * cos(angle1) + (-min_z) * sin(angle1) + self.y
-
-        z2 = (
-            (-max_x) * sin(angle2)
-            - (-min_y) * sin(angle1) * cos(angle2)
-            + (-min_z) * cos(angle1) * cos(angle2)
-            + self.z
-        )
+            probe_out = self.probe_out.value()
+            mins = mins + probe_out
+            maxs = maxs + probe_out
 
-        # P3
-        x3 = (
-            (-min_x) * cos(angle2)
-            - max_y * sin(angle1) * sin(angle2)
-            + (-min_z) * cos(angle1) * sin(angle2)
-            + self.x
-        )
+        # Get positions of box vertices (P1, P2, P3 and P4)
+        vertices = self._get_box_vertices(
+            mins, maxs, rotation, [self.x, self.y, self.z]
+        )[:4].tolist()
 
-        y3 = max_y * cos(angle1) + (-min_z) * sin(angle1) + self.y
+        # Create points
+        box = {
+            f"p{i}": {"x": x, "y": y, "z": z}
+            for i, (x, y, z) in enumerate(vertices, start=1)
+        }
 
-        z3 = (
-            -(-min_x) * sin(angle2)
-            - max_y * sin(angle1) * cos(angle2)
-            + (-min_z) * cos(angle1) * cos(angle2)
-            + self.z
-        )
+        return box
 
-        # P4
-        x4 = (
-            (-min_x) * cos(angle2)
-            - (-min_y) * sin(angle1) * sin(angle2)
-            + max_z * cos(angle1) * sin(angle2)
-            + self.x
-        )
+    @staticmethod
+    def _get_box_vertices(mins, maxs, rotation, center) -> np.ndarray:
+        """
+        Get xyz coordinates of the vertices (P1, ..., P8) of a custom box.
 
-        y4 = (-min_y) * cos(angle1) + max_z * sin(angle1) + self.y
+        The rotation matrix, given by the caller, is applied to all vertices at once.
 
-        z4 = (
-            -(-min_x) * sin(angle2)
-            - (-min_y) * sin(angle1) * cos(angle2)
-            + max_z * cos(angle1) * cos(angle2)
-            + self.z
-        )
+        Parameters
+        ----------
+        mins: numpy.ndarray
+            Distances of the minimum x, y and z coordinates from the center of the box
+        maxs: numpy.ndarray
+            Distances of the maximum x, y and z coordinates from the center of the box
+        rotation: numpy.ndarray
+            Rotation matrix of the custom box angles
+        center: list
+            xyz coordinates of the center of the box
 
-        # Create points
-        p1 = {"x": x1, "y": y1, "z": z1}
-        p2 = {"x": x2, "y": y2, "z": z2}
-        p3 = {"x": x3, "y": y3, "z": z3}
-        p4 = {"x": x4, "y": y4, "z": z4}
-        box = {"p1": p1, "p2": p2, "p3": p3, "p4": p4}
+        Returns
+        -------
+        vertices: numpy.ndarray
+            A NumPy array with xyz coordinates of P1, ..., P8 of the custom box
+        """
+        # Offsets of box vertices from the center of the box
+        offsets = np.where(_BOX_CORNERS, maxs, -mins)
 
-        return box
+        return offsets @ rotation.T + center
 
     def closeEvent(self, event) -> None:
         """
@@ -1656,11 +1366,8 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         This method establish some connections between Slots and Signals of the GUI thread and the worker thread.
         """
-        # Get KVFinder-web service status
-        server_status = _check_server_status(self.server)
-
-        # Start Worker thread
-        self.thread = Worker(self.server, server_status)
+        # Start Worker thread, that checks KVFinder-web service status itself before checking jobs, without blocking the GUI thread
+        self.thread = Worker(self.server, False)
         self.thread.start()
 
         # Communication between GUI and Worker threads
@@ -1701,15 +1408,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         data: dict
             A Python dictionary containing the data of a Job ID Form (class Form)
         """
-        from PyQt6 import QtNetwork
-        from PyQt6.QtCore import QUrl
-
         if verbosity in [1, 3]:
             print(f"[==> Requesting Job ID ({data['id']}) to KVFinder-web service ...")
 
         try:
             # Prepare request
-            url = QUrl(f"{self.server}/{data['id']}")
+            url = QtCore.QUrl(f"{self.server}/{data['id']}")
             request = QtNetwork.QNetworkRequest(url)
             request.setHeader(
                 QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader,
@@ -1726,69 +1430,32 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         """
         This methods handles the GET method response.
 
-        If there are no error in the request, this methods evaluates the response and process accordingly, by writing incoming results and job information to files.
+        If there are no error in the request, the response is evaluated by a _JobAdder runnable in a QThreadPool, that writes incoming results and job information to files outside of the GUI thread, and the job is included by _add_job method.
 
         If there are an error in the request, this method displays a QMessageBox with the corresponding error message and HTTP error code.
         """
-        from PyQt6 import QtNetwork
-
         # Get QNetwork error status
         error = self.reply.error()
 
         if error == QtNetwork.QNetworkReply.NetworkError.NoError:
-            # Read data retrived from server
-            reply = json.loads(str(self.reply.readAll(), "utf-8"))
-
-            # Create parameters
-            parameters = {
-                "status": reply["status"],
-                "id_added_manually": True,
-                "files": self.data["files"],
-                "modes": None,
-                "step_size": None,
-                "probes": None,
-                "cutoffs": None,
-                "visiblebox": None,
-                "internalbox": None,
-            }
-            if parameters["files"]["pdb"] is not None:
-                parameters["files"]["pdb"] = os.path.basename(
-                    parameters["files"]["pdb"]
-                ).replace(".pdb", "")
-            if parameters["files"]["ligand"] is not None:
-                parameters["files"]["ligand"] = os.path.basename(
-                    parameters["files"]["ligand"]
-                ).replace(".pdb", "")
-
-            # Create job file
-            job = Job(parameters)
-            job.id = self.data["id"]
-            job.id_added_manually = True
-            job.status = reply["status"]
-            job.output = reply
-
-            # Save job
-            job.save(job.id)
-
-            # Message to user
-            if verbosity in [1, 3]:
-                print("> Job successfully added!")
-            message = Message("Job successfully added!", job.id, job.status)
-            message.exec()
-
-            # Include job to available jobs
-            self.available_jobs.addItem(job.id)
+            # Get object names of molecular structures and save them, since PyMOL is only called from the GUI thread
+            files = self.data["files"]
+            if files["pdb"] is not None:
+                files["pdb"] = _get_pdb_name(files["pdb"])
+            if files["ligand"] is not None:
+                files["ligand"] = _get_pdb_name(files["ligand"])
+            try:
+                _save_pdbs(files)
+            except Exception as e:
+                print("Error occurred: ", e)
 
-            # Export
-            if job.status == "completed":
-                try:
-                    job.export()
-                except Exception as e:
-                    print("Error occurred: ", e)
+            # Create, save and export job in a thread pool
+            self._job_adder = _JobAdder(self.data, self.reply.readAll().data())
+            self._job_adder.signals.finished.connect(self._add_job)
+            self._job_adder.signals.error.connect(self._handle_add_job_error)
+            QtCore.QThreadPool.globalInstance().start(self._job_adder)
 
         elif error == QtNetwork.QNetworkReply.NetworkError.ContentNotFoundError:
-            from PyQt6 import QtWidgets
-
             # Message to user
             if verbosity in [1, 3]:
                 print(
@@ -1801,8 +1468,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             )
 
         elif error == QtNetwork.QNetworkReply.NetworkError.ConnectionRefusedError:
-            from PyQt6 import QtWidgets
-
             # Message to user
             if verbosity in [1, 3]:
                 print("> KVFinder-web service is Offline! Try again later!\n")
@@ -1815,6 +1480,46 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         # Clean data
         self.data = None
 
+        # Release reply, keeping its connection pooled by the network manager
+        self.reply.deleteLater()
+
+    @QtCore.pyqtSlot(object)
+    def _add_job(self, job: Job) -> None:
+        """
+        PyQt Slot that includes a job added by its ID to the "Available Jobs" combo box.
+
+        Parameters
+        ----------
+        job: Job
+            A Job object created, saved and exported by a _JobAdder runnable
+        """
+        self._job_adder = None
+
+        # Message to user
+        if verbosity in [1, 3]:
+            print("> Job successfully added!")
+        self._msg_added.set_values("Job successfully added!", job.id, job.status)
+        self._msg_added.open()
+
+        # Include job to available jobs
+        if job.id not in self._known_jobs:
+            self._known_jobs.add(job.id)
+            self.available_jobs.addItem(job.id)
+
+    @QtCore.pyqtSlot(str)
+    def _handle_add_job_error(self, error: str) -> None:
+        """
+        PyQt Slot that handles an error raised while a _JobAdder runnable adds a job.
+
+        Parameters
+        ----------
+        error: str
+            Error message
+        """
+        self._job_adder = None
+
+        print("Error occurred: ", error)
+
     def show_id(self) -> None:
         """
         Callback for "Show" button.
@@ -1829,15 +1534,11 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         # Get job path
         job_fn = os.path.join(
-            os.path.expanduser("~"),
-            ".KVFinder-web",
-            self.available_jobs.currentText(),
-            "job.toml",
+            _KVFINDER_DIR, self.available_jobs.currentText(), "job.toml"
         )
 
         # Get job information of ID
-        with open(job_fn, "r") as f:
-            job_info = toml.load(f=f)
+        job_info = _load_toml(job_fn)
 
         # Set results file
         results_file = f"{job_info['files']['output']}/{job_id}/{job_info['files']['base_name']}.KVFinder.results.toml"
@@ -1856,8 +1557,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         This method gets a path of results file and loads it on the visualization tab.
         The information loaded include: Input file, Ligand file, Cavities file, Step Size, Volume, Area and Interface Residues. Additionaly, it loads all files on PyMOL viewer.
         """
-        from pymol import cmd
-
         # Get results file
         results_file = self.vis_results_file_entry.text()
 
@@ -1865,8 +1564,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         if os.path.exists(results_file) and results_file.endswith(".toml"):
             print(f"> Loading results from: {self.vis_results_file_entry.text()}")
         else:
-            from PyQt6 import QtWidgets
-
             error_msg = QtWidgets.QMessageBox.critical(
                 self, "Error", "Results file cannot be opened! Check results file path."
             )
@@ -1876,15 +1573,13 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         global results
 
         # Read results file
-        results = toml.load(results_file)
+        results = _load_toml(results_file)
 
         if "FILES" in results.keys():
             results["FILES_PATH"] = results.pop("FILES")
         elif "FILES_PATH" in results.keys():
             pass
         else:
-            from PyQt6 import QtWidgets
-
             error_msg = QtWidgets.QMessageBox.critical(
                 self,
                 "Error",
@@ -1897,6 +1592,11 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             if "STEP" in results["PARAMETERS"].keys():
                 results["PARAMETERS"]["STEP_SIZE"] = results["PARAMETERS"].pop("STEP")
 
+        # Sort cavity indexes of all results once
+        self._cav_indexes = sorted(
+            set().union(*(results["RESULTS"][key] for key in self._RESULTS_LISTS))
+        )
+
         # Clean results
         self.clean_results()
 
@@ -1922,31 +1622,35 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         # Set default view in results
         self.default_view.setChecked(True)
 
-        # Load files as PyMOL objects
-        cmd.delete("cavities")
-        cmd.delete("residues")
-        cmd.frame(1)
-
-        # Load input
-        if "INPUT" in results["FILES_PATH"].keys():
-            input_fn = results["FILES_PATH"]["INPUT"]
-            self.input_pdb = os.path.basename(input_fn.replace(".pdb", ""))
-            self.load_file(input_fn, self.input_pdb)
-        else:
-            self.input_pdb = None
+        # Load files as PyMOL objects, with viewer updates suspended until all are loaded
+        cmd.set("suspend_updates", "on")
+        try:
+            cmd.delete("cavities")
+            cmd.delete("residues")
+            cmd.frame(1)
+
+            # Load input
+            if "INPUT" in results["FILES_PATH"].keys():
+                input_fn = results["FILES_PATH"]["INPUT"]
+                self.input_pdb = _get_pdb_name(input_fn)
+                self.load_file(input_fn, self.input_pdb)
+            else:
+                self.input_pdb = None
 
-        # Load ligand
-        if "LIGAND" in results["FILES_PATH"].keys():
-            ligand_fn = results["FILES_PATH"]["LIGAND"]
-            self.ligand_pdb = os.path.basename(ligand_fn.replace(".pdb", ""))
-            self.load_file(ligand_fn, self.ligand_pdb)
-        else:
-            self.ligand_pdb = None
+            # Load ligand
+            if "LIGAND" in results["FILES_PATH"].keys():
+                ligand_fn = results["FILES_PATH"]["LIGAND"]
+                self.ligand_pdb = _get_pdb_name(ligand_fn)
+                self.load_file(ligand_fn, self.ligand_pdb)
+            else:
+                self.ligand_pdb = None
 
-        # Load cavity
-        cavity_fn = results["FILES_PATH"]["OUTPUT"]
-        self.cavity_pdb = os.path.basename(cavity_fn.replace(".pdb", ""))
-        self.load_cavity(cavity_fn, self.cavity_pdb)
+            # Load cavity
+            cavity_fn = results["FILES_PATH"]["OUTPUT"]
+            self.cavity_pdb = _get_pdb_name(cavity_fn)
+            self.load_cavity(cavity_fn, self.cavity_pdb)
+        finally:
+            cmd.set("suspend_updates", "off")
 
         return
 
@@ -1956,8 +1660,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         This method opens a QFileDialog to select a results file of parKVFinder.
         """
-        from PyQt6 import QtCore, QtWidgets
-
         # Get results file
         fname, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
@@ -1967,7 +1669,8 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         )
 
         if fname:
-            fname = QtCore.QDir.toNativeSeparators(fname)
+            if _NEEDS_NATIVE_SEP:
+                fname = QtCore.QDir.toNativeSeparators(fname)
             if os.path.exists(fname):
                 self.vis_results_file_entry.setText(fname)
 
@@ -1987,16 +1690,27 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         name: str
             Cavity object name
         """
-        from pymol import cmd
+        # Keep object loaded from the same unmodified cavity file
+        signature = _get_file_signature(fname)
+        names = cmd.get_names("all")
+        if (
+            name in names
+            and signature is not None
+            and loaded_files.get(name) == signature
+        ):
+            cmd.hide("everything", name)
+            cmd.show("nonbonded", name)
+            return
 
         # Remove previous results in objects with same cavity name
-        for obj in cmd.get_names("all"):
-            if name == obj:
-                cmd.delete(obj)
+        if name in names:
+            cmd.delete(name)
+        loaded_files.pop(name, None)
 
         # Load cavity filename
-        if os.path.exists(fname):
+        if signature is not None:
             cmd.load(fname, name, zoom=0)
+            loaded_files[name] = signature
             cmd.hide("everything", name)
             cmd.show("nonbonded", name)
 
@@ -2014,55 +1728,101 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         name: str
             Object name
         """
-        from pymol import cmd
+        # Keep object loaded from the same unmodified pdb file
+        signature = _get_file_signature(fname)
+        names = cmd.get_names("all")
+        if (
+            name in names
+            and signature is not None
+            and loaded_files.get(name) == signature
+        ):
+            return
 
         # Remove previous results in objects with same pdb name
-        for obj in cmd.get_names("all"):
-            if name == obj:
-                cmd.delete(obj)
+        if name in names:
+            cmd.delete(name)
+        loaded_files.pop(name, None)
 
         # Load pdb filename
-        if os.path.exists(fname):
+        if signature is not None:
             cmd.load(fname, name, zoom=0)
+            loaded_files[name] = signature
 
     def refresh_information(self) -> None:
         """
         Fill "Information" frame on the Visualization tab.
         """
+        files_path = results["FILES_PATH"]
+
         # Input File
-        if "INPUT" in results["FILES_PATH"].keys():
-            self.vis_input_file_entry.setText(f"{results['FILES_PATH']['INPUT']}")
+        if "INPUT" in files_path:
+            self.vis_input_file_entry.setText(f"{files_path['INPUT']}")
         else:
             self.vis_input_file_entry.setText(f"")
 
         # Ligand File
-        if "LIGAND" in results["FILES_PATH"].keys():
-            self.vis_ligand_file_entry.setText(f"{results['FILES_PATH']['LIGAND']}")
+        if "LIGAND" in files_path:
+            self.vis_ligand_file_entry.setText(f"{files_path['LIGAND']}")
         else:
             self.vis_ligand_file_entry.setText(f"")
 
         # Cavities File
-        self.vis_cavities_file_entry.setText(f"{results['FILES_PATH']['OUTPUT']}")
+        self.vis_cavities_file_entry.setText(f"{files_path['OUTPUT']}")
 
         # Step Size
-        if "PARAMETERS" in results.keys():
-            if "STEP_SIZE" in results["PARAMETERS"].keys():
-                self.vis_step_size_entry.setText(
-                    f"{results['PARAMETERS']['STEP_SIZE']:.2f}"
-                )
+        parameters = results.get("PARAMETERS", {})
+        if "STEP_SIZE" in parameters:
+            self.vis_step_size_entry.setText(f"{parameters['STEP_SIZE']:.2f}")
 
         return
 
+    def _get_cav_indexes(self, key) -> list:
+        """
+        Get sorted cavity indexes of a result, filtered from the cavity indexes sorted once by load_results.
+
+        Parameters
+        ----------
+        key: str
+            A key of the results dictionary (VOLUME, AREA, AVG_DEPTH, MAX_DEPTH, AVG_HYDROPATHY or RESIDUES)
+
+        Returns
+        -------
+        indexes: list
+            A list of sorted cavity indexes of the result
+        """
+        result = results["RESULTS"][key]
+        return [index for index in self._cav_indexes if index in result]
+
+    @staticmethod
+    def _add_list_items(list_widget, items) -> None:
+        """
+        Add items to a QListWidget at once, with its signals blocked and repaints suspended.
+
+        Parameters
+        ----------
+        list_widget: QListWidget
+            A target QListWidget of the results tab
+        items: list
+            A list of item texts to add to the QListWidget
+        """
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.addItems(items)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+
     def refresh_volume(self) -> None:
         """
         Fill "Volume" QListBox with volume information of the results file.
         """
         # Get cavity indexes
-        indexes = sorted(results["RESULTS"]["VOLUME"].keys())
+        indexes = self._get_cav_indexes("VOLUME")
         # Include Volume
-        for index in indexes:
-            item = f"{index}: {results['RESULTS']['VOLUME'][index]}"
-            self.volume_list.addItem(item)
+        volume = results["RESULTS"]["VOLUME"]
+        items = [f"{index}: {volume[index]}" for index in indexes]
+        self._add_list_items(self.volume_list, items)
         return
 
     def refresh_area(self) -> None:
@@ -2070,39 +1830,42 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         Fill "Surface Area" QListBox with volume information of the results file.
         """
         # Get cavity indexes
-        indexes = sorted(results["RESULTS"]["AREA"].keys())
+        indexes = self._get_cav_indexes("AREA")
         # Include Area
-        for index in indexes:
-            item = f"{index}: {results['RESULTS']['AREA'][index]}"
-            self.area_list.addItem(item)
+        area = results["RESULTS"]["AREA"]
+        items = [f"{index}: {area[index]}" for index in indexes]
+        self._add_list_items(self.area_list, items)
         return
 
     def refresh_avg_depth(self) -> None:
         # Get cavity indexes
-        indexes = sorted(results["RESULTS"]["AVG_DEPTH"].keys())
+        indexes = self._get_cav_indexes("AVG_DEPTH")
         # Include Average Depth
-        for index in indexes:
-            item = f"{index}: {results['RESULTS']['AVG_DEPTH'][index]}"
-            self.avg_depth_list.addItem(item)
+        avg_depth = results["RESULTS"]["AVG_DEPTH"]
+        items = [f"{index}: {avg_depth[index]}" for index in indexes]
+        self._add_list_items(self.avg_depth_list, items)
         return
 
     def refresh_max_depth(self) -> None:
         # Get cavity indexes
-        indexes = sorted(results["RESULTS"]["MAX_DEPTH"].keys())
+        indexes = self._get_cav_indexes("MAX_DEPTH")
         # Include Maximum Depth
-        for index in indexes:
-            item = f"{index}: {results['RESULTS']['MAX_DEPTH'][index]}"
-            self.max_depth_list.addItem(item)
+        max_depth = results["RESULTS"]["MAX_DEPTH"]
+        items = [f"{index}: {max_depth[index]}" for index in indexes]
+        self._add_list_items(self.max_depth_list, items)
         return
 
     def refresh_avg_hydropathy(self) -> None:
         # Get cavity indexes
-        indexes = sorted(results["RESULTS"]["AVG_HYDROPATHY"].keys())
+        indexes = self._get_cav_indexes("AVG_HYDROPATHY")
         # Include Average Hydropathy
-        for index in indexes:
-            if index != "EisenbergWeiss":
-                item = f"{index}: {results['RESULTS']['AVG_HYDROPATHY'][index]}"
-                self.avg_hydropathy_list.addItem(item)
+        avg_hydropathy = results["RESULTS"]["AVG_HYDROPATHY"]
+        items = [
+            f"{index}: {avg_hydropathy[index]}"
+            for index in indexes
+            if index != "EisenbergWeiss"
+        ]
+        self._add_list_items(self.avg_hydropathy_list, items)
         return
 
     def refresh_residues(self) -> None:
@@ -2110,18 +1873,15 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         Fill "Interface Residues" QListBox with volume information of the results file.
         """
         # Get cavity indexes
-        indexes = sorted(results["RESULTS"]["RESIDUES"].keys())
+        indexes = self._get_cav_indexes("RESIDUES")
         # Include Interface Residues
-        for index in indexes:
-            self.residues_list.addItem(index)
+        self._add_list_items(self.residues_list, indexes)
         return
 
     def show_residues(self) -> None:
         """
         Creates a object named 'residues' on PyMOL viewer to display interface residues surrounding the cavity tags selected on the "Interface Residues" QListBox.
         """
-        from pymol import cmd
-
         # Get selected cavities from residues list
         cavs = [item.text() for item in self.residues_list.selectedItems()]
 
@@ -2134,27 +1894,21 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         if len(cavs) < 1:
             return
 
-        # Get residues from cavities selected
-        residues = []
-        for cav in cavs:
-            for residue in results["RESULTS"]["RESIDUES"][cav]:
-                if residue not in residues:
-                    residues.append(residue)
+        # Get unique residues from cavities selected, keeping their order
+        residues = dict.fromkeys(
+            tuple(residue)
+            for cav in cavs
+            for residue in results["RESULTS"]["RESIDUES"][cav]
+        )
 
         # Check if input pdb is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.input_pdb:
-                control = 1
-        if control == 0:
+        if self.input_pdb not in cmd.get_names("all"):
             return
 
         # Select residues
-        command = f"{self.input_pdb} and"
-        while len(residues) > 0:
-            res, chain, _ = residues.pop(0)
-            command = f"{command} (resid {res} and chain {chain}) or"
-        command = f"{command[:-3]}"
+        command = f"{self.input_pdb} and " + " or ".join(
+            f"(resid {res} and chain {chain})" for res, chain, _ in residues
+        )
         cmd.select("res", command)
 
         # Create residues object
@@ -2166,19 +1920,67 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         cmd.enable(self.cavity_pdb)
         cmd.set("auto_zoom", 1)
 
-    def show_cavities(self, list1, list2) -> None:
-        from pymol import cmd
+    def _schedule_selection(self, callback) -> None:
+        """
+        Schedule a results list callback to run after 50 ms, coalescing bursts of selection changes of each results list into a single update of PyMOL viewer.
+
+        Parameters
+        ----------
+        callback: functools.partial
+            Bound callback of a results list (show_cavities, show_depth or show_hydropathy).
+        """
+        if not self._pending_selection:
+            QtCore.QTimer.singleShot(50, self._run_pending_selection)
+        # Keep one pending entry per callback, in scheduling order
+        self._pending_selection[callback] = None
+
+    def _run_pending_selection(self) -> None:
+        """
+        Run every results list callback scheduled by _schedule_selection method since the last run.
+        """
+        pending, self._pending_selection = self._pending_selection, {}
+        for callback in pending:
+            callback()
+
+    def _get_list_tags(self, list_widget) -> list:
+        """
+        Get cavity tags of the items of a results list, that are sliced from the item texts only once per loaded results.
+
+        Parameters
+        ----------
+        list_widget: QListWidget
+            A target QListWidget of the results tab
+
+        Returns
+        -------
+        tags: list
+            A list of cavity tags (e.g. KAA) of the items of the QListWidget
+        """
+        tags = self._list_tags.get(list_widget)
+        if tags is None or len(tags) != list_widget.count():
+            tags = self._list_tags[list_widget] = [
+                list_widget.item(index).text()[0:3]
+                for index in range(list_widget.count())
+            ]
+        return tags
 
+    def show_cavities(self, list1, list2) -> None:
         # Get items from list1
         cavs = [item.text()[0:3] for item in list1.selectedItems()]
 
-        # Select items of list2
+        # Select items of list2 with its signals blocked, since its callback would rebuild the same object
+        selected = set(cavs)
+        tags = self._get_list_tags(list2)
         number_of_items = list1.count()
-        for index in range(number_of_items):
-            if list2.item(index).text()[0:3] in cavs:
-                list2.item(index).setSelected(True)
-            else:
-                list2.item(index).setSelected(False)
+        list2.blockSignals(True)
+        try:
+            for index in range(number_of_items):
+                item = list2.item(index)
+                is_selected = tags[index] in selected
+                if item.isSelected() != is_selected:
+                    item.setSelected(is_selected)
+        finally:
+            list2.blockSignals(False)
 
         # Clean objects
         cmd.set("auto_zoom", 0)
@@ -2190,18 +1992,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             return
 
         # Check if cavity file is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.cavity_pdb:
-                control = 1
-        if control == 0:
+        names = set(cmd.get_names("all"))
+        if self.cavity_pdb not in names:
             return
 
         # Color filling cavity points as blue nonbonded
-        command = f"obj {self.cavity_pdb} and (resname "
-        while len(cavs) > 0:
-            command = f"{command}{cavs.pop(0)},"
-        command = f"{command[:-1]})"
+        command = f"obj {self.cavity_pdb} and (resname {','.join(cavs)})"
         cmd.select("cavs", command)
 
         # Create cavities object with blue nonbonded
@@ -2219,28 +2015,31 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         # Reset cavities output object
         cmd.disable(self.cavity_pdb)
         cmd.enable(self.cavity_pdb)
-        for item in cmd.get_names("all"):
-            if item == "hydropathy":
-                cmd.disable("hydropathy")
-                cmd.enable("hydropathy")
-            if item == "depths":
-                cmd.disable("depths")
-                cmd.enable("depths")
+        if "hydropathy" in names:
+            cmd.disable("hydropathy")
+            cmd.enable("hydropathy")
+        if "depths" in names:
+            cmd.disable("depths")
+            cmd.enable("depths")
         cmd.set("auto_zoom", 1)
 
     def show_depth(self, list1, list2) -> None:
-        from pymol import cmd
-
         # Get items from list1
         cavs = [item.text()[0:3] for item in list1.selectedItems()]
 
-        # Select items of list2
+        # Select items of list2 with its signals blocked, since its callback would rebuild the same object
+        selected = set(cavs)
+        tags = self._get_list_tags(list2)
         number_of_items = list1.count()
-        for index in range(number_of_items):
-            if list2.item(index).text()[0:3] in cavs:
-                list2.item(index).setSelected(True)
-            else:
-                list2.item(index).setSelected(False)
+        list2.blockSignals(True)
+        try:
+            for index in range(number_of_items):
+                item = list2.item(index)
+                is_selected = tags[index] in selected
+                if item.isSelected() != is_selected:
+                    item.setSelected(is_selected)
+        finally:
+            list2.blockSignals(False)
 
         # Clean objects
         cmd.set("auto_zoom", 0)
@@ -2252,18 +2051,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             return
 
         # Check if cavity file is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.cavity_pdb:
-                control = 1
-        if control == 0:
+        names = set(cmd.get_names("all"))
+        if self.cavity_pdb not in names:
             return
 
         # Color filling cavity points as blue nonbonded
-        command = f"obj {self.cavity_pdb} and (resname "
-        while len(cavs) > 0:
-            command = f"{command}{cavs.pop(0)},"
-        command = f"{command[:-1]})"
+        command = f"obj {self.cavity_pdb} and (resname {','.join(cavs)})"
         cmd.select("deps", command)
 
         # Create cavities object with blue nonbonded
@@ -2274,19 +2067,17 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         # Reset cavities output object
         cmd.disable(self.cavity_pdb)
-        for item in cmd.get_names("all"):
-            if item == "cavities":
-                cmd.disable("cavities")
-                cmd.enable("cavities")
-            if item == "depths":
-                cmd.disable("hydropathy")
-                cmd.enable("hydropathy")
+        if "cavities" in names:
+            cmd.disable("cavities")
+            cmd.enable("cavities")
+        # depths object was created after names were taken
+        if "depths" in cmd.get_names("all"):
+            cmd.disable("hydropathy")
+            cmd.enable("hydropathy")
         cmd.enable(self.cavity_pdb)
         cmd.set("auto_zoom", 1)
 
     def show_hydropathy(self, list1) -> None:
-        from pymol import cmd
-
         # Get items from list1
         cavs = [item.text()[0:3] for item in list1.selectedItems()]
 
@@ -2300,18 +2091,14 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
             return
 
         # Check if cavity file is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.cavity_pdb:
-                control = 1
-        if control == 0:
+        names = set(cmd.get_names("all"))
+        if self.cavity_pdb not in names:
             return
 
         # Color filling cavity points as blue nonbonded
-        command = f"obj {self.cavity_pdb} and (resname "
-        while len(cavs) > 0:
-            command = f"{command}{cavs.pop(0)},"
-        command = f"{command[:-1]}) and (name HA+HS)"
+        command = (
+            f"obj {self.cavity_pdb} and (resname {','.join(cavs)}) and (name HA+HS)"
+        )
         cmd.select("hyd", command)
 
         # Create cavities object with blue nonbonded
@@ -2322,29 +2109,22 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         # Reset cavities output object
         cmd.disable(self.cavity_pdb)
-        for item in cmd.get_names("all"):
-            if item == "cavities":
-                cmd.disable("cavities")
-                cmd.enable("cavities")
-            if item == "depths":
-                cmd.disable("depths")
-                cmd.enable("depths")
+        if "cavities" in names:
+            cmd.disable("cavities")
+            cmd.enable("cavities")
+        if "depths" in names:
+            cmd.disable("depths")
+            cmd.enable("depths")
         cmd.enable(self.cavity_pdb)
         cmd.set("auto_zoom", 1)
 
     def show_default_view(self) -> None:
-        from pymol import cmd
-
         # Clean objects
         cmd.set("auto_zoom", 0)
         cmd.delete("view")
 
         # Check if cavity file is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.cavity_pdb:
-                control = 1
-        if control == 0:
+        if self.cavity_pdb not in cmd.get_names("all"):
             return
 
         # Color filling cavity points as blue nonbonded
@@ -2359,18 +2139,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         cmd.delete("view")
 
     def show_depth_view(self) -> None:
-        from pymol import cmd
-
         # Clean objects
         cmd.set("auto_zoom", 0)
         cmd.delete("view")
 
         # Check if cavity file is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.cavity_pdb:
-                control = 1
-        if control == 0:
+        if self.cavity_pdb not in cmd.get_names("all"):
             return
 
         # Color filling cavity points as blue nonbonded
@@ -2385,18 +2159,12 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         cmd.delete("view")
 
     def show_hydropathy_view(self) -> None:
-        from pymol import cmd
-
         # Clean objects
         cmd.set("auto_zoom", 0)
         cmd.delete("view")
 
         # Check if cavity file is loaded
-        control = 0
-        for item in cmd.get_names("all"):
-            if item == self.cavity_pdb:
-                control = 1
-        if control == 0:
+        if self.cavity_pdb not in cmd.get_names("all"):
             return
 
         # Color filling cavity points as blue nonbonded
@@ -2416,33 +2184,69 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         This method removes all information displayed in the fields of the "Visualization" tab.
         """
-        # Input File
-        self.vis_input_file_entry.setText(f"")
+        self._list_tags.clear()
+        self.setUpdatesEnabled(False)
+        try:
+            # Input File
+            self.vis_input_file_entry.setText(f"")
 
-        # Ligand File
-        self.vis_ligand_file_entry.setText(f"")
+            # Ligand File
+            self.vis_ligand_file_entry.setText(f"")
 
-        # Cavities File
-        self.vis_cavities_file_entry.setText(f"")
+            # Cavities File
+            self.vis_cavities_file_entry.setText(f"")
 
-        # Step Size
-        self.vis_step_size_entry.setText(f"")
+            # Step Size
+            self.vis_step_size_entry.setText(f"")
+
+            # Volume
+            self.volume_list.clear()
+
+            # Area
+            self.area_list.clear()
+
+            # Depth
+            self.avg_depth_list.clear()
+            self.max_depth_list.clear()
+
+            # Hydropathy
+            self.avg_hydropathy_list.clear()
 
-        # Volume
-        self.volume_list.clear()
+            # Residues
+            self.residues_list.clear()
+        finally:
+            self.setUpdatesEnabled(True)
 
-        # Area
-        self.area_list.clear()
+    def _request_server_status(self) -> None:
+        """
+        Checks KVFinder-web service status without blocking the GUI thread.
+
+        The GET method response is handled by _handle_server_status_response method, that sets the "Server Status" field.
+        """
+        try:
+            # Prepare request
+            url = QtCore.QUrl(self.server.replace("api", ""))
+            request = QtNetwork.QNetworkRequest(url)
+            request.setTransferTimeout(_SERVER_STATUS_TIMEOUT)
+
+            # Get request
+            self.status_reply = self.network_manager.get(request)
+            self.status_reply.finished.connect(self._handle_server_status_response)
+        except Exception as e:
+            print("Error occurred: ", e)
 
-        # Depth
-        self.avg_depth_list.clear()
-        self.max_depth_list.clear()
+    def _handle_server_status_response(self) -> None:
+        """
+        This method handles the GET method response of the KVFinder-web service status.
 
-        # Hydropathy
-        self.avg_hydropathy_list.clear()
+        If there are no error in the request, the "Server Status" field is set to Online. Otherwise, it is set to Offline.
+        """
+        # Get QNetworkReply error status
+        error = self.status_reply.error()
 
-        # Residues
-        self.residues_list.clear()
+        # Set server status in GUI
+        self.set_server_status(error == QtNetwork.QNetworkReply.NetworkError.NoError)
+        self.status_reply.deleteLater()
 
     @QtCore.pyqtSlot(bool)
     def set_server_status(self, status) -> None:
@@ -2486,6 +2290,7 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         current = self.available_jobs.currentText()
 
         # Update available jobs
+        self._known_jobs = set(available_jobs)
         self.available_jobs.clear()
         self.available_jobs.addItems(available_jobs)
 
@@ -2499,21 +2304,19 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
 
         This method displays, on "Job Information" frame, the job status, input file, ligand file, output directory and parameters file.
         """
-        if self.available_jobs.currentText() != "":
+        job_id = self.available_jobs.currentText()
+        if job_id != "":
             # Get job path
-            job_fn = os.path.join(
-                os.path.expanduser("~"),
-                ".KVFinder-web",
-                self.available_jobs.currentText(),
-                "job.toml",
-            )
+            job_fn = os.path.join(_KVFINDER_DIR, job_id, "job.toml")
 
-            # Read job file
-            with open(job_fn, "r") as f:
-                job_info = toml.load(f=f)
+            # Read job file, parsed again only after it is modified
+            job_info = _load_toml(job_fn)
 
             # Fill job information labels
-            status = job_info["status"].capitalize()
+            status = (
+                _STATUS_DISPLAY.get(job_info["status"])
+                or job_info["status"].capitalize()
+            )
             if status == "Queued" or status == "Running":
                 self.job_status_entry.setText(status)
                 self.job_status_entry.setStyleSheet("color: blue;")
@@ -2546,7 +2349,7 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
                         self.job_ligand_entry.setText(f"Not available")
             else:
                 self.job_parameters_entry.setText(
-                    f"{job_info['files']['output']}/{self.available_jobs.currentText()}/{job_info['files']['base_name']}_parameters.toml"
+                    f"{job_info['files']['output']}/{job_id}/{job_info['files']['base_name']}_parameters.toml"
                 )
         else:
             # Disable button
@@ -2568,8 +2371,6 @@ class PyMOLKVFinderWebTools(QtWidgets.QMainWindow):
         job_id: str
             Job ID
         """
-        from PyQt6 import QtWidgets
-
         # Message to user
         message = QtWidgets.QMessageBox(self)
         message.setWindowTitle(f"Job Notification")
@@ -2591,7 +2392,20 @@ class Job(object):
     Object handles job information.
     """
 
-    def __init__(self, parameters: Optional[Dict[str, Any]]):
+    __slots__ = (
+        "status",
+        "pdb",
+        "ligand",
+        "output_directory",
+        "base_name",
+        "id_added_manually",
+        "id",
+        "input",
+        "output",
+        "_payload",
+    )
+
+    def __init__(self, parameters: Optional[Dict[str, Any]], read_pdb: bool = True):
         """
         Create a Job object with default attributes and fill it with the parameters from the GUI.
 
@@ -2599,6 +2413,8 @@ class Job(object):
         ----------
         parameters: dict
             Python dictionary containing detection parameters and molecular structures names loaded in PyMOL
+        read_pdb: bool
+            Whether the molecular structures are read to be sent to KVFinder-web service
         """
         # Job Information (local)
         self.status: Optional[str] = None
@@ -2611,8 +2427,9 @@ class Job(object):
         self.id: Optional[str] = None
         self.input: Optional[Dict[str, Any]] = {}
         self.output: Optional[Dict[str, Any]] = None
+        self._payload: Optional[QtCore.QByteArray] = None
         # Upload parameters in self.input
-        self.upload(parameters)
+        self.upload(parameters, read_pdb)
 
     @property
     def cavity(self) -> Optional[Dict[str, Any]]:
@@ -2650,6 +2467,22 @@ class Job(object):
         else:
             return self.output["output"]["log"]
 
+    @property
+    def payload(self) -> QtCore.QByteArray:
+        """
+        Defines payload as a property.
+
+        The request information (self.input) is serialized to a compact JSON only once, then it is reused by later requests. When orjson is available, the PDB strings are encoded to UTF-8 directly, without being converted to QString by QJsonDocument.
+        """
+        if self._payload is None:
+            if _json is json:
+                self._payload = QtCore.QJsonDocument(self.input).toJson(
+                    QtCore.QJsonDocument.JsonFormat.Compact
+                )
+            else:
+                self._payload = QtCore.QByteArray(_json.dumps(self.input))
+        return self._payload
+
     def _add_pdb(self, pdb_fn: str, is_ligand: bool = False) -> None:
         """
         Reads a PDB-formatted file of a molecular structure to be sent to KVFinder-web service.
@@ -2663,14 +2496,18 @@ class Job(object):
         is_ligand: bool
             Whether the molecular structure should be treated as a ligand in parKVFinder software
         """
-        with open(pdb_fn) as f:
-            pdb = f.read()
+        # Read whole file in a single unbuffered read and decode it at once,
+        # translating newlines as text mode does
+        with open(pdb_fn, "rb", buffering=0) as f:
+            pdb = f.read().decode("ascii", "replace").replace("\r\n", "\n")
         if is_ligand:
             self.input["pdb_ligand"] = pdb
         else:
             self.input["pdb"] = pdb
 
-    def upload(self, parameters: Optional[Dict[str, Any]]) -> None:
+    def upload(
+        self, parameters: Optional[Dict[str, Any]], read_pdb: bool = True
+    ) -> None:
         """
         Loads job information from a Python dictionary containing the parameters.
 
@@ -2678,9 +2515,9 @@ class Job(object):
         ----------
         parameters: dict
             Python dictionary containing detection parameters and molecular structures names loaded in PyMOL
+        read_pdb: bool
+            Whether the molecular structures, saved by _save_pdbs function in the GUI thread, are read to be sent to KVFinder-web service. Otherwise, only their paths are set, e.g. for jobs polled by the worker thread
         """
-        from pymol import cmd
-
         # Job Information (local)
         # Status
         self.status = parameters["status"]
@@ -2698,39 +2535,34 @@ class Job(object):
                 self.pdb = os.path.join(
                     self.output_directory, parameters["files"]["pdb"] + ".pdb"
                 )
-                if not os.path.exists(self.pdb):
-                    if parameters["files"]["pdb"] in cmd.get_names("all"):
-                        cmd.save(self.pdb, parameters["files"]["pdb"], 0, "pdb")
         # Ligand PDB
         if "ligand" in parameters["files"].keys():
             if parameters["files"]["ligand"] is not None:
                 self.ligand = os.path.join(
                     self.output_directory, parameters["files"]["ligand"] + ".pdb"
                 )
-                if not os.path.exists(self.ligand):
-                    if parameters["files"]["ligand"] in cmd.get_names("all"):
-                        cmd.save(self.ligand, parameters["files"]["ligand"], 0, "pdb")
         # Request information (service)
         # Input PDB
-        if self.pdb:
+        if read_pdb and self.pdb:
             self._add_pdb(self.pdb)
         # Ligand PDB
-        if self.ligand:
+        if read_pdb and self.ligand:
             self._add_pdb(self.ligand, is_ligand=True)
         # Settings
-        self.input["settings"] = dict()
-        # Modes
-        self.input["settings"]["modes"] = parameters["modes"]
-        # Step size
-        self.input["settings"]["step_size"] = parameters["step_size"]
-        # Probes
-        self.input["settings"]["probes"] = parameters["probes"]
-        # Cutoffs
-        self.input["settings"]["cutoffs"] = parameters["cutoffs"]
-        # Visible box
-        self.input["settings"]["visiblebox"] = parameters["visiblebox"]
-        # Internal box
-        self.input["settings"]["internalbox"] = parameters["internalbox"]
+        self.input["settings"] = {
+            # Modes
+            "modes": parameters["modes"],
+            # Step size
+            "step_size": parameters["step_size"],
+            # Probes
+            "probes": parameters["probes"],
+            # Cutoffs
+            "cutoffs": parameters["cutoffs"],
+            # Visible box
+            "visiblebox": parameters["visiblebox"],
+            # Internal box
+            "internalbox": parameters["internalbox"],
+        }
 
     def save(self, id: int) -> None:
         """
@@ -2744,33 +2576,31 @@ class Job(object):
             Job ID
         """
         # Create job directory in ~/.KVFinder-web/
-        job_dn = os.path.join(os.path.expanduser("~"), ".KVFinder-web", str(id))
-        try:
-            os.mkdir(job_dn)
-        except FileExistsError:
-            pass
+        job_dn = os.path.join(_KVFINDER_DIR, str(id))
+        if not os.path.isdir(job_dn):
+            os.makedirs(job_dn, exist_ok=True)
+            _clear_jobs_cache()
 
         # Create job file inside ~/.KVFinder-web/id
         job_fn = os.path.join(job_dn, "job.toml")
+        job_info = {"title": "KVFinder-web job file", "status": self.status}
+        if self.id_added_manually:
+            job_info["id_added_manually"] = True
+        job_info["files"] = {
+            "pdb": self.pdb,
+            "ligand": self.ligand,
+            "output": self.output_directory,
+            "base_name": self.base_name,
+        }
+        job_info.update(self.input["settings"])
         with open(job_fn, "w") as f:
-            f.write("# TOML configuration file for KVFinder-web job\n\n")
-            f.write('title = "KVFinder-web job file"\n\n')
-            f.write(f'status = "{self.status}"\n\n')
-            if self.id_added_manually:
-                f.write(f"id_added_manually = true\n\n")
-            f.write(f"[files]\n")
-            if self.pdb is not None:
-                f.write(f'pdb = "{self.pdb}"\n')
-            if self.ligand is not None:
-                f.write(f'ligand = "{self.ligand}"\n')
-            f.write(f'output = "{self.output_directory}"\n')
-            f.write(f'base_name = "{self.base_name}"\n')
-            f.write("\n")
-            toml.dump(o=self.input["settings"], f=f)
-            f.write("\n")
+            f.write(
+                "# TOML configuration file for KVFinder-web job\n\n"
+                + _dumps_toml(job_info)
+            )
 
     @classmethod
-    def load(cls, fn: Optional[str]) -> Job:
+    def load(cls, fn: Optional[str], read_pdb: bool = True) -> Job:
         """
         Creates a Job object with job information from a TOML-formatted file.
 
@@ -2780,37 +2610,21 @@ class Job(object):
         ----------
         fn: str
             Path to a TOML-formatted file containing job information
+        read_pdb: bool
+            Whether the molecular structures are read to be sent to KVFinder-web service
 
         Returns
         -------
         Job: Job
             A Job object with attributes loaded from a file containing job information
         """
-        # Read job file
-        with open(fn, "r") as f:
-            job_info = toml.load(f=f)
-
-        # Fix pdb and ligand in job_info
-        if "pdb" in job_info["files"].keys():
-            job_info["files"]["pdb"] = os.path.basename(
-                job_info["files"]["pdb"]
-            ).replace(".pdb", "")
-        if "ligand" in job_info["files"].keys():
-            job_info["files"]["ligand"] = os.path.basename(
-                job_info["files"]["ligand"]
-            ).replace(".pdb", "")
-
-        # Treat manually added id
-        if "id_added_manually" in job_info.keys():
-            if job_info["id_added_manually"]:
-                job_info["modes"] = None
-                job_info["step_size"] = None
-                job_info["probes"] = None
-                job_info["cutoffs"] = None
-                job_info["visiblebox"] = None
-                job_info["internalbox"] = None
-
-        return cls(job_info)
+        # Read job file, reusing its fixed job information while the file is not modified
+        st = os.stat(fn)
+        job_info = copy.deepcopy(
+            _load_job_cached(os.path.abspath(fn), st.st_mtime_ns, st.st_size)
+        )
+
+        return cls(job_info, read_pdb)
 
     def export(self) -> None:
         """
@@ -2821,60 +2635,171 @@ class Job(object):
         # Prepare base file
         base_dir = os.path.join(self.output_directory, self.id)
 
-        try:
-            os.mkdir(base_dir)
-        except FileExistsError:
-            pass
+        os.makedirs(base_dir, exist_ok=True)
+
+        # Get output retrieved from KVFinder-web service
+        output = self.output["output"]
 
         # Export cavity
         cavity_fn = os.path.join(base_dir, f"{self.base_name}.KVFinder.output.pdb")
         with open(cavity_fn, "w") as f:
-            f.write(self.cavity)
+            f.write(output["pdb_kv"])
 
         # Export report
         report_fn = os.path.join(base_dir, f"{self.base_name}.KVFinder.results.toml")
-        report = toml.loads(self.report)
+        report = _tomllib.loads(output["report"])
         report["FILES_PATH"]["INPUT"] = self.pdb
         report["FILES_PATH"]["LIGAND"] = self.ligand
         report["FILES_PATH"]["OUTPUT"] = cavity_fn
         with open(report_fn, "w") as f:
-            f.write("# TOML results file for parKVFinder software\n\n")
-            toml.dump(o=report, f=f)
+            f.write(
+                "# TOML results file for parKVFinder software\n\n" + _dumps_toml(report)
+            )
+
+        # Export log, with job ID as target and without detection dictionary
+        def _rewrite(match: re.Match) -> str:
+            if match.group(1) == "Dictionary: ":
+                return ""
+            return f"Running parKVFinder for job ID: {self.id}{match.group(2)}"
 
-        # Export log
         log_fn = os.path.join(base_dir, "KVFinder.log")
+        # Every line is newline-terminated before substitution, so a dropped last line also drops its newline
+        log = _LOG_RE.sub(_rewrite, f"{output['log']}\n")
         with open(log_fn, "w") as f:
-            for line in self.log.split("\n"):
-                if "Running parKVFinder for: " in line:
-                    line = f"Running parKVFinder for job ID: {self.id}"
-                    f.write(f"{line}\n")
-                elif "Dictionary: " in line:
-                    pass
-                else:
-                    f.write(f"{line}\n")
+            f.write(log)
 
         # Export parameters
         if not self.id_added_manually:
             parameter_fn = os.path.join(
                 self.output_directory, self.id, f"{self.base_name}_parameters.toml"
             )
+            ligand = self.ligand if self.ligand is not None else "-"
+            parameters = (
+                "# TOML configuration file for KVFinder-web job.\n\n"
+                'title = "KVFinder-web parameters file"\n\n'
+                "[files]\n"
+                "# The path of the input PDB file.\n"
+                f'pdb = "{self.pdb}"\n'
+                "# The path for the ligand's PDB file.\n"
+                f'ligand = "{ligand}"\n'
+                "\n"
+                "[settings]\n"
+                "# Settings for cavity detection.\n\n"
+                f'{_dumps_toml({"settings": self.input["settings"]})}\n'
+            )
             with open(parameter_fn, "w") as f:
-                f.write("# TOML configuration file for KVFinder-web job.\n\n")
-                f.write('title = "KVFinder-web parameters file"\n\n')
-                f.write(f"[files]\n")
-                f.write("# The path of the input PDB file.\n")
-                f.write(f'pdb = "{self.pdb}"\n')
-                f.write("# The path for the ligand's PDB file.\n")
-                if self.ligand is not None:
-                    f.write(f'ligand = "{self.ligand}"\n')
-                else:
-                    f.write(f'ligand = "-"\n')
-                f.write("\n")
-                f.write(f"[settings]\n")
-                f.write(f"# Settings for cavity detection.\n\n")
-                settings = {"settings": self.input["settings"]}
-                toml.dump(o=settings, f=f)
-                f.write("\n")
+                f.write(parameters)
+
+
+class _JobSignals(QtCore.QObject):
+    """
+    Signals of _JobLoader and _JobAdder runnables.
+    """
+
+    finished = QtCore.pyqtSignal(object)
+    error = QtCore.pyqtSignal(str)
+
+
+class _JobLoader(QtCore.QRunnable):
+    """
+    Runnable that creates a Job (class Job) in a QThreadPool.
+
+    The molecular structures, saved by _save_pdbs function in the GUI thread, are read, and the request payload is serialized, outside of the GUI thread.
+    """
+
+    def __init__(self, parameters: Dict[str, Any]):
+        super(_JobLoader, self).__init__()
+        """
+        Construct a runnable with the parameters of a job.
+
+        Parameters
+        ----------
+        parameters: dict
+            Python dictionary containing detection parameters and molecular structures names loaded in PyMOL
+        """
+        self.parameters = parameters
+        self.signals = _JobSignals()
+
+    def run(self) -> None:
+        """
+        Creates a Job object and emits it through the finished signal. If an error occurs, it is emitted through the error signal.
+        """
+        try:
+            job = Job(self.parameters)
+            # Serialize request information
+            job.payload
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(job)
+
+
+class _JobAdder(QtCore.QRunnable):
+    """
+    Runnable that creates a Job (class Job), added by its ID, in a QThreadPool.
+
+    The response of KVFinder-web service is parsed, and the job information and incoming results are written to files, outside of the GUI thread.
+    """
+
+    def __init__(self, data: Dict[str, Any], reply: bytes):
+        super(_JobAdder, self).__init__()
+        """
+        Construct a runnable with the data of a Job ID Form and the response of KVFinder-web service.
+
+        Parameters
+        ----------
+        data: dict
+            A Python dictionary containing the data of a Job ID Form (class Form)
+        reply: bytes
+            Data retrieved from KVFinder-web service
+        """
+        self.data = data
+        self.reply = reply
+        self.signals = _JobSignals()
+
+    def run(self) -> None:
+        """
+        Creates, saves and exports a Job object and emits it through the finished signal. If an error occurs, it is emitted through the error signal.
+        """
+        try:
+            # Read data retrived from server
+            reply = _json.loads(self.reply)
+            status = reply["status"]
+
+            # Create parameters, with object names of molecular structures got in the GUI thread
+            parameters = {
+                "status": status,
+                "id_added_manually": True,
+                "files": self.data["files"],
+                "modes": None,
+                "step_size": None,
+                "probes": None,
+                "cutoffs": None,
+                "visiblebox": None,
+                "internalbox": None,
+            }
+
+            # Create job file, without reading molecular structures that are not sent
+            job = Job(parameters, read_pdb=False)
+            job.id = self.data["id"]
+            job.id_added_manually = True
+            job.status = status
+            job.output = reply
+
+            # Save job
+            job.save(job.id)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        # Export
+        if job.status == "completed":
+            try:
+                job.export()
+            except Exception as e:
+                print("Error occurred: ", e)
+
+        self.signals.finished.emit(job)
 
 
 class Worker(QtCore.QThread):
@@ -2904,7 +2829,9 @@ class Worker(QtCore.QThread):
             Whether the KVFinder-web service defined by global variable 'server' is Online or Offline
         """
         self.server = server
-        self.wait = False
+        # Set while the worker thread is not waiting for user interaction
+        self.resume = threading.Event()
+        self.resume.set()
         self.server_status = server_status
 
     def run(self) -> None:
@@ -2923,18 +2850,30 @@ class Worker(QtCore.QThread):
 
         If, for some reason, the KVFinder-web service is unreachable, the worker thread will communicate the GUI thread, that will change the value of the "Server Status" field to Offline. Otherwise, the "Server Status" field will be set to Online.
         """
-        from PyQt6 import QtCore
+        # Create network manager of worker thread, reused by all GETs of the thread (created here and not in __init__, that runs in the GUI thread)
+        self.network_manager = QtNetwork.QNetworkAccessManager()
+        self.network_manager.setTransferTimeout()
+
+        # Prepare request template for job GETs (multiplexed over HTTP/2 when available)
+        self.request = QtNetwork.QNetworkRequest()
+        self.request.setHeader(
+            QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader,
+            "application/json",
+        )
+        self.request.setAttribute(
+            QtNetwork.QNetworkRequest.Attribute.Http2AllowedAttribute, True
+        )
+
+        # Pending replies of job GETs and loop that waits for them
+        self.replies = set()
+        self.replies_loop = QtCore.QEventLoop()
 
         # Times completed jobs with results are not checked in KVFinder-web service
         counter = 0
 
         while True:
-            # Loop to wait QMessageBox signal from GUI thread that delete jobs that are no long available in KVFinder-web service
-            while self.wait:
-                # Wait timer to check wait status
-                loop = QtCore.QEventLoop()
-                QtCore.QTimer.singleShot(time_wait_status, loop.quit)
-                loop.exec()
+            # Wait QMessageBox signal from GUI thread that delete jobs that are no long available in KVFinder-web service
+            self.resume.wait()
 
             # Constantly getting available jobs
             jobs = _get_jobs()
@@ -2955,41 +2894,37 @@ class Worker(QtCore.QThread):
                     if verbosity in [2, 3]:
                         print(f"> Checking Job ID: {job_id}")
 
-                    # Get job information
-                    job_fn = os.path.join(
-                        os.path.expanduser("~"), ".KVFinder-web", job_id, "job.toml"
-                    )
-                    self.job_info = Job.load(fn=job_fn)
-                    self.job_info.id = job_id
+                    # Get job information from its cached job file, without reading molecular structures that are not sent again
+                    job_fn = os.path.join(_KVFINDER_DIR, job_id, "job.toml")
+                    job = Job.load(fn=job_fn, read_pdb=False)
+                    job.id = job_id
 
                     # Save current status
-                    status = self.job_info.status
+                    status = job.status
 
                     # Handle job status
                     if status == "queued" or status == "running":
                         # Get request for job results
-                        self._get_results(job_id)
+                        self._get_results(job)
 
                     elif status == "completed":
                         # Check if results files exist
-                        output_exists = self._check_output_exists()
+                        output_exists = self._check_output_exists(job)
 
                         if not output_exists:
-                            self._get_results(job_id)
+                            self._get_results(job)
                         else:
                             # If completed jobs with results reaches times_job_completed_no_checked counter (10), try to get job results
                             if counter == times_job_completed_no_checked:
-                                self._get_results(job_id)
+                                self._get_results(job)
                                 counter = 0
 
                             # Indicate that there is at least one job completed with downloaded
                             flag = True
 
-                    # Wait timer to check next available job
-                    if len(jobs) > 1:
-                        loop = QtCore.QEventLoop()
-                        QtCore.QTimer.singleShot(time_between_jobs, loop.quit)
-                        loop.exec()
+                # Wait all job GETs, that were submitted simultaneously
+                if self.replies:
+                    self.replies_loop.exec()
 
                 # If at least one job completed with downloaded results, increment counter
                 if flag:
@@ -2997,9 +2932,7 @@ class Worker(QtCore.QThread):
                     flag = False
 
                 # Wait timer to restart available job checks
-                loop = QtCore.QEventLoop()
-                QtCore.QTimer.singleShot(time_restart_job_checks, loop.quit)
-                loop.exec()
+                self.msleep(time_restart_job_checks)
 
             # No jobs available to check status
             else:
@@ -3008,7 +2941,7 @@ class Worker(QtCore.QThread):
                     print("> Checking KVFinder-web service status ...")
 
                 # Check service status
-                status = _check_server_status(self.server)
+                status = _check_server_status(self.server, self.network_manager)
                 while not status:
                     if verbosity in [2, 3]:
                         print(
@@ -3018,59 +2951,59 @@ class Worker(QtCore.QThread):
                     self.server_status_signal.emit(status)
 
                     # Wait timer to repeat service status check
-                    loop = QtCore.QEventLoop()
-                    QtCore.QTimer.singleShot(time_server_down, loop.quit)
-                    loop.exec()
+                    self.msleep(time_server_down)
 
                     # Message to user
                     if verbosity in [2, 3]:
                         print("> Checking KVFinder-web service status ...")
 
+                    # Check service status again
+                    status = _check_server_status(self.server, self.network_manager)
+
                 # Update server_status value
+                was_up = self.server_status
                 self.server_status = status
                 # Send signal that service is up
                 self.server_status_signal.emit(self.server_status)
 
-                # Wait timer when no jobs are being checked
-                loop = QtCore.QEventLoop()
-                QtCore.QTimer.singleShot(time_no_jobs, loop.quit)
-                loop.exec()
+                # Wait timer when no jobs are being checked, unless service has just come up with jobs to check
+                if was_up or not jobs:
+                    self.msleep(time_no_jobs)
+
+            # Release replies deleted later, since no event loop runs while the worker thread sleeps
+            QtCore.QCoreApplication.sendPostedEvents(
+                None, QtCore.QEvent.Type.DeferredDelete
+            )
 
             if dialog is None:
                 self.terminate()
 
-    def _get_results(self, job_id) -> None:
+    def _get_results(self, job) -> None:
         """
         Submit a GET method to the KVFinder-web service for a Job ID.
 
+        The GET is submitted without waiting for previous GETs, so all job GETs of a loop share the connection of the worker network manager.
+
         Parameters
         ----------
-        job_id: str
-            Job ID
+        job: Job
+            Job with information loaded from its TOML-formatted file
         """
-        from PyQt6 import QtNetwork
-        from PyQt6.QtCore import QUrl
-
         try:
-            self.network_manager = QtNetwork.QNetworkAccessManager()
-
             # Prepare request
-            url = QUrl(f"{self.server}/{job_id}")
-            request = QtNetwork.QNetworkRequest(url)
-            request.setHeader(
-                QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader,
-                "application/json",
-            )
+            request = QtNetwork.QNetworkRequest(self.request)
+            request.setUrl(QtCore.QUrl(f"{self.server}/{job.id}"))
 
             # Get Request
-            self.reply = self.network_manager.get(request)
-            self.reply.finished.connect(self._handle_get_response)
+            reply = self.network_manager.get(request)
+            reply.finished.connect(partial(self._handle_get_response, reply, job))
+            self.replies.add(reply)
         except Exception as e:
             print("Error occurred: ", e)
 
-    def _handle_get_response(self) -> None:
+    def _handle_get_response(self, reply, job) -> None:
         """
-        Handles the GET method response.
+        Handles the GET method response of a job.
 
         This methods evaluates the response and process accordingly.
 
@@ -3079,25 +3012,33 @@ class Worker(QtCore.QThread):
         If there is a Content error, the job is erased from ~/.KVFinder-web directory, because it is no longer available on the KVFinder-web service.
 
         If there is a Connection error, the worker thread will communicate the GUI thread, that will change the value of the "Server Status" field to Offline.
-        """
-        from PyQt6 import QtNetwork
 
+        Parameters
+        ----------
+        reply: QtNetwork.QNetworkReply
+            Reply of the GET method
+        job: Job
+            Job which the GET method was submitted for
+        """
         # Get QNetwork error status
-        error = self.reply.error()
+        error = reply.error()
 
         if error == QtNetwork.QNetworkReply.NetworkError.NoError:
             # Read data retrived from service
-            reply = json.loads(str(self.reply.readAll(), "utf-8"))
+            output = _json.loads(reply.readAll().data())
 
             # Pass outputs to Job class
-            self.job_info.output = reply
-            self.job_info.status = reply["status"]
-            self.job_info.save(self.job_info.id)
+            job.output = output
 
-            # Export results
-            if self.job_info.status == "completed":
+            # Save job file only when status changed, otherwise it would be rewritten unchanged
+            if output["status"] != job.status:
+                job.status = output["status"]
+                job.save(job.id)
+
+            # Export results, unless they were already exported
+            if job.status == "completed" and not self._check_output_exists(job):
                 try:
-                    self.job_info.export()
+                    job.export()
                 except Exception as e:
                     print("Error occurred: ", e)
 
@@ -3109,13 +3050,11 @@ class Worker(QtCore.QThread):
             self.server_up.emit()
 
             # Send Job Id to GUI Thread
-            self.wait = True
-            self.id_signal.emit(self.job_info.id)
+            self.resume.clear()
+            self.id_signal.emit(job.id)
 
             # Remove job id from .KVFinder-web
-            job_dn = os.path.join(
-                os.path.expanduser("~"), ".KVFinder-web", self.job_info.id
-            )
+            job_dn = os.path.join(_KVFINDER_DIR, job.id)
             try:
                 self.erase_job_dir(job_dn)
                 self.available_jobs_signal.emit(_get_jobs())
@@ -3130,41 +3069,43 @@ class Worker(QtCore.QThread):
             # Send Server Down Signal to GUI Thread
             self.server_down.emit()
 
-    def _check_output_exists(self) -> bool:
+        # Release reply and stop waiting when all job GETs are handled
+        reply.deleteLater()
+        self.replies.discard(reply)
+        if not self.replies:
+            self.replies_loop.quit()
+
+    def _check_output_exists(self, job) -> bool:
         """
         Checks if the output of a Job already exists.
 
+        Parameters
+        ----------
+        job: Job
+            Job with information loaded from its TOML-formatted file
+
         Returns
         -------
         exist: bool
             Whether any of the output files exist
         """
         # Prepare base file
-        base_dir = os.path.join(self.job_info.output_directory, self.job_info.id)
+        base_dir = os.path.join(job.output_directory, job.id)
 
-        # Get output files paths
-        log = os.path.join(base_dir, "KVFinder.log")
-        report = os.path.join(
-            base_dir, f"{self.job_info.base_name}.KVFinder.results.toml"
-        )
-        cavity = os.path.join(
-            base_dir, f"{self.job_info.base_name}.KVFinder.output.pdb"
-        )
-        if not self.job_info.id_added_manually:
-            parameters = os.path.join(
-                base_dir, f"{self.job_info.base_name}_parameters.toml"
-            )
-        else:
-            parameters = True
+        # Get names of files inside base directory in a single directory read
+        try:
+            with os.scandir(base_dir) as it:
+                entries = {entry.name for entry in it}
+        except OSError:
+            return False
 
         # Check if files exist
-        log_exist = os.path.exists(log)
-        report_exist = os.path.exists(report)
-        cavity_exist = os.path.exists(cavity)
-        try:
-            parameters_exist = os.path.exists(parameters)
-        except Exception:
-            parameters_exist = True
+        log_exist = "KVFinder.log" in entries
+        report_exist = f"{job.base_name}.KVFinder.results.toml" in entries
+        cavity_exist = f"{job.base_name}.KVFinder.output.pdb" in entries
+        parameters_exist = (
+            job.id_added_manually or f"{job.base_name}_parameters.toml" in entries
+        )
 
         exist = log_exist and report_exist and cavity_exist and parameters_exist
 
@@ -3173,16 +3114,19 @@ class Worker(QtCore.QThread):
     @QtCore.pyqtSlot(bool)
     def wait_status(self, status) -> None:
         """
-        PyQt Slot that change the wait attribute to True or False.
+        PyQt Slot that clears or sets the resume event.
 
-        This slot defines if the worker thread should wait for user interaction.
+        This slot defines if the worker thread should wait for user interaction, blocking it until the event is set again.
 
         Parameters
         ----------
         status: bool
             Whether is to wait for user interaction
         """
-        self.wait = status
+        if status:
+            self.resume.clear()
+        else:
+            self.resume.set()
 
     @staticmethod
     def erase_job_dir(d) -> None:
@@ -3194,13 +3138,8 @@ class Worker(QtCore.QThread):
         d: str
             Path to a job directory to be erased
         """
-        for f in os.listdir(d):
-            f = os.path.join(d, f)
-            if os.path.isdir(f):
-                Worker.erase_job_dir(f)
-            else:
-                os.remove(f)
-        os.rmdir(d)
+        shutil.rmtree(d)
+        _clear_jobs_cache()
 
 
 class Form(QtWidgets.QDialog):
@@ -3226,6 +3165,9 @@ class Form(QtWidgets.QDialog):
         # Define server
         self.server = server
 
+        # Define directory where Browse dialogs start, read once for the Form
+        self.cwd = os.getcwd()
+
     def initialize_gui(self, output_dir) -> None:
         """
         Defines Form GUI with Qt interface and hook up button callbacks.
@@ -3235,8 +3177,6 @@ class Form(QtWidgets.QDialog):
         output_dir: str
             Path to output directory
         """
-        from PyQt6 import QtCore, QtWidgets
-
         # Set Window Title
         self.setWindowTitle("Job ID Form")
 
@@ -3349,10 +3289,10 @@ class Form(QtWidgets.QDialog):
         # hook up QDialog buttons callbacks
         self.button_browse_output_dir.clicked.connect(self.select_directory)
         self.button_browse_input_file.clicked.connect(
-            lambda: self.select_file(self.input_file, "Choose Input PDB File")
+            partial(self.select_file, self.input_file, "Choose Input PDB File")
         )
         self.button_browse_ligand_file.clicked.connect(
-            lambda: self.select_file(self.ligand_file, "Choose Ligand PDB File")
+            partial(self.select_file, self.ligand_file, "Choose Ligand PDB File")
         )
         self.buttons.accepted.connect(self.add_job_id)
         self.buttons.rejected.connect(self.close)
@@ -3363,18 +3303,17 @@ class Form(QtWidgets.QDialog):
 
         If there are missing information, return an error. Otherwise, accept data.
         """
+        # Get filled fields
+        job_id = self.job_id.text()
+        base_name = self.base_name.text()
+        output_dir = self.output_dir.text()
+
         # Handle button click by user
-        # Ok
-        if (
-            self.job_id.text()
-            and os.path.isdir(self.output_dir.text())
-            and self.base_name.text()
-        ):
+        # Ok (text fields are checked before output directory is checked in the file system)
+        if job_id and base_name and output_dir and os.path.isdir(output_dir):
             return self.accept()
         # Cancel
         else:
-            from PyQt6 import QtWidgets
-
             # Message to user
             if verbosity in [2, 3]:
                 print(
@@ -3403,10 +3342,8 @@ class Form(QtWidgets.QDialog):
             "files": {
                 "base_name": self.base_name.text(),
                 "output": self.output_dir.text(),
-                "pdb": self.input_file.text() if self.input_file.text() != "" else None,
-                "ligand": self.ligand_file.text()
-                if self.ligand_file.text() != ""
-                else None,
+                "pdb": self.input_file.text() or None,
+                "ligand": self.ligand_file.text() or None,
             },
         }
         return data
@@ -3415,18 +3352,22 @@ class Form(QtWidgets.QDialog):
         """
         Callback for the "Browse ..." button
 
-        This method opens a QFileDialog to select a directory.
+        This method opens a QFileDialog to select a directory, that sets the selected directory when accepted.
         """
-        from PyQt6 import QtCore, QtWidgets
 
-        fname = QtWidgets.QFileDialog.getExistingDirectory(
-            caption="Choose Output Directory", directory=os.getcwd()
-        )
+        # Set selected directory, that QFileDialog only returns if it exists
+        def _set_directory(fname: str) -> None:
+            if _NEEDS_NATIVE_SEP:
+                fname = QtCore.QDir.toNativeSeparators(fname)
+            self.output_dir.setText(fname)
 
-        if fname:
-            fname = QtCore.QDir.toNativeSeparators(fname)
-            if os.path.isdir(fname):
-                self.output_dir.setText(fname)
+        # Open dialog without blocking the event loop
+        file_dialog = QtWidgets.QFileDialog(self, "Choose Output Directory", self.cwd)
+        file_dialog.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        file_dialog.setFileMode(QtWidgets.QFileDialog.FileMode.Directory)
+        file_dialog.setOption(QtWidgets.QFileDialog.Option.ShowDirsOnly)
+        file_dialog.fileSelected.connect(_set_directory)
+        file_dialog.open()
 
         return
 
@@ -3434,21 +3375,22 @@ class Form(QtWidgets.QDialog):
         """
         Callback for the "Browse ..." button
 
-        This method opens a QFileDialog to select a file.
+        This method opens a QFileDialog to select a file, that sets the selected file when accepted and clears the entry when canceled.
         """
-        from PyQt6 import QtCore, QtWidgets
 
-        # Get results file
-        fname, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, caption=caption, directory=os.getcwd(), filter="PDB file (*.pdb)"
-        )
+        # Set selected file, that QFileDialog only returns if it exists
+        def _set_file(fname: str) -> None:
+            if _NEEDS_NATIVE_SEP:
+                fname = QtCore.QDir.toNativeSeparators(fname)
+            entry.setText(fname)
 
-        if fname:
-            fname = QtCore.QDir.toNativeSeparators(fname)
-            if os.path.exists(fname):
-                entry.setText(fname)
-        else:
-            entry.clear()
+        # Open dialog without blocking the event loop
+        file_dialog = QtWidgets.QFileDialog(self, caption, self.cwd, "PDB file (*.pdb)")
+        file_dialog.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        file_dialog.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFile)
+        file_dialog.fileSelected.connect(_set_file)
+        file_dialog.rejected.connect(entry.clear)
+        file_dialog.open()
 
         return
 
@@ -3458,6 +3400,16 @@ class Message(QtWidgets.QDialog):
     Class that defines a custom QDialog that displays the Job ID, Job status and a notification of a Job submission.
     """
 
+    # Information icon shared between messages, rendered when the first message is created
+    _ICON_PIXMAP: Optional[QtGui.QPixmap] = None
+
+    # Style sheets of job status
+    _STATUS_STYLES = {
+        "queued": "color: blue;",
+        "running": "color: blue;",
+        "completed": "color: green;",
+    }
+
     def __init__(
         self,
         msg: str,
@@ -3481,14 +3433,16 @@ class Message(QtWidgets.QDialog):
             Notification from the KVFinder-web service
         """
         # Initialize Message GUI
-        self.initialize_gui(msg, job_id, status, notification)
+        self.initialize_gui()
 
         # Set Values in Message GUI
         self.set_values(msg, job_id, status, notification)
 
-    def set_values(self, msg, job_id, status, notification) -> None:
+    def set_values(self, msg, job_id=None, status=None, notification=None) -> None:
         """
-        Fill the Message GUI with information from the job submitted
+        Fill the Message GUI with information from the job submitted.
+
+        Fields without information are hidden, so the same Message can be reused for several notifications.
 
         Parameters
         ----------
@@ -3501,42 +3455,36 @@ class Message(QtWidgets.QDialog):
         notification: str
             Notification from the KVFinder-web service
         """
-        # Message
-        self.msg.setText(msg)
-
-        # Job ID
-        if job_id:
-            self.job_id.setText(job_id)
-
-        # Status
-        if status:
-            self.status.setText(status.capitalize())
-            if status == "queued" or status == "running":
-                self.status.setStyleSheet("color: blue;")
-            elif status == "completed":
-                self.status.setStyleSheet("color: green;")
+        # Fill fields with a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Message
+            self.msg.setText(msg)
+
+            # Job ID
+            self.job_id_label.setVisible(bool(job_id))
+            self.job_id.setVisible(bool(job_id))
+            self.job_id.setText(job_id if job_id else "")
+
+            # Status
+            self.status_label.setVisible(bool(status))
+            self.status.setVisible(bool(status))
+            if status:
+                self.status.setText(_STATUS_DISPLAY.get(status) or status.capitalize())
+                self.status.setStyleSheet(self._STATUS_STYLES.get(status, ""))
+            else:
+                self.status.clear()
 
-        # Notification
-        if notification:
-            self.notification.setText(notification)
+            # Notification
+            self.notification.setVisible(bool(notification))
+            self.notification.setText(notification if notification else "")
+        finally:
+            self.setUpdatesEnabled(True)
 
-    def initialize_gui(self, msg, job_id, status, notification) -> None:
+    def initialize_gui(self) -> None:
         """
         Defines Message GUI with Qt interface and hook up button callbacks.
-
-        Parameters
-        ----------
-        msg: str
-            Message to be displayed on the Job Submission window
-        job_id: str
-            Job ID
-        status: str
-            Job status
-        notification: str
-            Notification from the KVFinder-web service
         """
-        from PyQt6 import QtCore, QtGui, QtWidgets
-
         # Set Window Title
         self.setWindowTitle("Job Submission")
 
@@ -3545,15 +3493,16 @@ class Message(QtWidgets.QDialog):
         self.setFixedSize(425, 200)
 
         # Create message layout
-        self.hframe1 = QtWidgets.QHBoxLayout(self)
+        self.hframe1 = QtWidgets.QHBoxLayout()
         # Icon
         self.icon = QtWidgets.QLabel(self)
-        pixmap = (
-            self.style()
-            .standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MessageBoxInformation)
-            .pixmap(30, 30, QtGui.QIcon.Mode.Active, QtGui.QIcon.State.On)
-        )
-        self.icon.setPixmap(pixmap)
+        if Message._ICON_PIXMAP is None:
+            Message._ICON_PIXMAP = (
+                self.style()
+                .standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MessageBoxInformation)
+                .pixmap(30, 30, QtGui.QIcon.Mode.Active, QtGui.QIcon.State.On)
+            )
+        self.icon.setPixmap(Message._ICON_PIXMAP)
         self.icon.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.icon.setSizePolicy(
             QtWidgets.QSizePolicy(
@@ -3576,81 +3525,78 @@ class Message(QtWidgets.QDialog):
         )
 
         # Create Job ID layout
-        self.hframe2 = QtWidgets.QHBoxLayout(self)
-        if job_id:
-            # Job ID label
-            self.job_id_label = QtWidgets.QLabel(self)
-            self.job_id_label.setText("Job ID:")
-            self.job_id_label.setSizePolicy(
-                QtWidgets.QSizePolicy(
-                    QtWidgets.QSizePolicy.Policy.Fixed,
-                    QtWidgets.QSizePolicy.Policy.Preferred,
-                )
+        self.hframe2 = QtWidgets.QHBoxLayout()
+        # Job ID label
+        self.job_id_label = QtWidgets.QLabel(self)
+        self.job_id_label.setText("Job ID:")
+        self.job_id_label.setSizePolicy(
+            QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Fixed,
+                QtWidgets.QSizePolicy.Policy.Preferred,
             )
-            self.job_id_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            # Job ID entry
-            self.job_id = QtWidgets.QLineEdit(self)
-            self.job_id.setSizePolicy(
-                QtWidgets.QSizePolicy(
-                    QtWidgets.QSizePolicy.Policy.Minimum,
-                    QtWidgets.QSizePolicy.Policy.Fixed,
-                )
+        )
+        self.job_id_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # Job ID entry
+        self.job_id = QtWidgets.QLineEdit(self)
+        self.job_id.setSizePolicy(
+            QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Minimum,
+                QtWidgets.QSizePolicy.Policy.Fixed,
             )
-            self.job_id.setReadOnly(True)
-            self.job_id.setFixedWidth(200)
-            # add to layout
-            self.hframe2.addWidget(self.job_id_label)
-            self.hframe2.addWidget(self.job_id)
-            self.hframe2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        )
+        self.job_id.setReadOnly(True)
+        self.job_id.setFixedWidth(200)
+        # add to layout
+        self.hframe2.addWidget(self.job_id_label)
+        self.hframe2.addWidget(self.job_id)
+        self.hframe2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         # Create Status layout
-        self.hframe3 = QtWidgets.QHBoxLayout(self)
-        if status:
-            # Job ID label
-            self.status_label = QtWidgets.QLabel(self)
-            self.status_label.setText("Status:")
-            self.status_label.setSizePolicy(
-                QtWidgets.QSizePolicy(
-                    QtWidgets.QSizePolicy.Policy.Fixed,
-                    QtWidgets.QSizePolicy.Policy.Preferred,
-                )
+        self.hframe3 = QtWidgets.QHBoxLayout()
+        # Job ID label
+        self.status_label = QtWidgets.QLabel(self)
+        self.status_label.setText("Status:")
+        self.status_label.setSizePolicy(
+            QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Fixed,
+                QtWidgets.QSizePolicy.Policy.Preferred,
             )
-            self.status_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            # Job ID entry
-            self.status = QtWidgets.QLineEdit(self)
-            self.status.setSizePolicy(
-                QtWidgets.QSizePolicy(
-                    QtWidgets.QSizePolicy.Policy.Minimum,
-                    QtWidgets.QSizePolicy.Policy.Fixed,
-                )
+        )
+        self.status_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # Job ID entry
+        self.status = QtWidgets.QLineEdit(self)
+        self.status.setSizePolicy(
+            QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Minimum,
+                QtWidgets.QSizePolicy.Policy.Fixed,
             )
-            self.status.setReadOnly(True)
-            font = QtGui.QFont()
-            font.setBold(True)
-            self.status.setFont(font)
-            self.status.setFixedWidth(90)
-            self.status.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            # add to layout
-            self.hframe3.addWidget(self.status_label)
-            self.hframe3.addWidget(self.status)
-            self.hframe3.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        )
+        self.status.setReadOnly(True)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.status.setFont(font)
+        self.status.setFixedWidth(90)
+        self.status.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # add to layout
+        self.hframe3.addWidget(self.status_label)
+        self.hframe3.addWidget(self.status)
+        self.hframe3.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         # Create Notification layout
-        self.hframe4 = QtWidgets.QHBoxLayout(self)
-        if notification:
-            # Notification entry
-            self.notification = QtWidgets.QTextEdit(self)
-            self.notification.setSizePolicy(
-                QtWidgets.QSizePolicy(
-                    QtWidgets.QSizePolicy.Policy.Expanding,
-                    QtWidgets.QSizePolicy.Policy.Expanding,
-                )
+        self.hframe4 = QtWidgets.QHBoxLayout()
+        # Notification entry
+        self.notification = QtWidgets.QTextEdit(self)
+        self.notification.setSizePolicy(
+            QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Expanding,
+                QtWidgets.QSizePolicy.Policy.Expanding,
             )
-            self.notification.setReadOnly(True)
-            self.notification.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            # add to layout
-            self.hframe4.addWidget(self.notification)
-            self.hframe4.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        )
+        self.notification.setReadOnly(True)
+        self.notification.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # add to layout
+        self.hframe4.addWidget(self.notification)
+        self.hframe4.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         # Vertical spacer
         self.vspacer2 = QtWidgets.QSpacerItem(
@@ -3681,35 +3627,58 @@ class Message(QtWidgets.QDialog):
         self.buttonBox.accepted.connect(self.accept)
 
 
-def _check_server_status(server) -> bool:
+def _check_server_status(server, network_manager) -> bool:
     """
-    Check server status before worker threads is started.
+    Check server status, waiting for the reply in a local event loop of the calling thread.
+
+    This function blocks until the reply is finished or times out, so it is only called by the worker thread. The GUI thread checks server status asynchronously.
 
     Parameters
     ----------
     server: str
         KVFinder-web service address (Default: http://kvfinder-web.cnpem.br). Users may set this variable to a locally configured KVFinder-web service by changing 'server' global variable
+    network_manager: QtNetwork.QNetworkAccessManager
+        Network manager of the calling thread, whose connections are reused by the request
 
     Returns
     -------
     status: bool
         Whether the server is Online or Offline
     """
-    from PyQt6 import QtNetwork
-    from PyQt6.QtCore import QUrl
-
     try:
-        req = QtNetwork.QNetworkRequest(QUrl(server.replace("api", "")))
-        newtork_manager = QtNetwork.QNetworkAccessManager()
-        reply = newtork_manager.get(req)
-        if reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
-            return True
-        else:
-            return False
+        req = QtNetwork.QNetworkRequest(QtCore.QUrl(server.replace("api", "")))
+        req.setTransferTimeout(_SERVER_STATUS_TIMEOUT)
+        reply = network_manager.get(req)
+
+        # Wait reply
+        loop = QtCore.QEventLoop()
+        reply.finished.connect(loop.quit)
+        loop.exec()
+
+        status = reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError
+        reply.deleteLater()
+        return status
     except Exception:
         return False
 
 
+def _get_network_manager() -> QtNetwork.QNetworkAccessManager:
+    """
+    Gets the network manager of the GUI thread, that is created only once and shared between dialogs.
+
+    Returns
+    -------
+    network_manager: QtNetwork.QNetworkAccessManager
+        A QNetworkAccessManager that keeps the connection pool, cookies and TLS sessions of the GUI thread
+    """
+    global network_manager
+
+    if network_manager is None:
+        network_manager = QtNetwork.QNetworkAccessManager()
+
+    return network_manager
+
+
 def _get_jobs() -> list:
     """
     Gets jobs registered inside ~/.KVFinder-web directory.
@@ -3719,16 +3688,241 @@ def _get_jobs() -> list:
     jobs: list
         A Python list of Job IDs
     """
-    # Get job dir
-    d = os.path.join(os.path.expanduser("~"), ".KVFinder-web/")
+    global jobs_cache
+
+    # Get jobs availables in dir, unless it was not modified since they were read
+    mtime_ns = os.stat(_KVFINDER_DIR).st_mtime_ns
+    if jobs_cache is None or jobs_cache[0] != mtime_ns:
+        with os.scandir(_KVFINDER_DIR) as it:
+            jobs_cache = (mtime_ns, [entry.name for entry in it])
+
+    return list(jobs_cache[1])
+
+
+def _clear_jobs_cache() -> None:
+    """
+    Clears jobs read from ~/.KVFinder-web directory, so jobs registered or erased in the same modification time of the directory are read again.
+    """
+    global jobs_cache
+
+    jobs_cache = None
+
+
+def _get_pdb_name(fn: str) -> str:
+    """
+    Gets the PyMOL object name of a PDB-formatted file, that is its basename without the .pdb extension.
+
+    Parameters
+    ----------
+    fn: str
+        Path to a PDB-formatted file
+
+    Returns
+    -------
+    name: str
+        The basename of the file, with only a trailing .pdb extension removed
+    """
+    name = os.path.basename(fn)
+    if name.endswith(".pdb"):
+        name = name[: -len(".pdb")]
+    return name
+
+
+def _save_pdbs(files: Dict[str, Any]) -> None:
+    """
+    Saves input and ligand molecular structures loaded in PyMOL to PDB-formatted files in the output directory, unless the files already exist.
+
+    This function calls PyMOL, so it must run in the GUI thread, before the job is created in a QThreadPool.
+
+    Parameters
+    ----------
+    files: dict
+        Python dictionary containing the object names of input and ligand molecular structures and the output directory
+    """
+    # Objects loaded in PyMOL, queried once and only if an input or ligand PDB is missing
+    names = None
+    for name in (files.get("pdb"), files.get("ligand")):
+        if name is None:
+            continue
+        pdb_fn = os.path.join(files["output"], name + ".pdb")
+        if not os.path.exists(pdb_fn):
+            if names is None:
+                names = set(cmd.get_names("all"))
+            if name in names:
+                cmd.save(pdb_fn, name, 0, "pdb")
+
+
+def _get_file_signature(fn: str) -> Optional[Tuple[str, int]]:
+    """
+    Gets the signature of a file, that changes whenever the file is modified.
+
+    Parameters
+    ----------
+    fn: str
+        Path to a file
+
+    Returns
+    -------
+    signature: tuple, optional
+        A tuple with the absolute path and the modification time (ns) of the file, or None if the file does not exist
+    """
+    try:
+        return os.path.abspath(fn), os.stat(fn).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_toml(fn: str) -> Dict[str, Any]:
+    """
+    Loads a TOML-formatted file, reusing its parsed content while the file is not modified.
+
+    Parameters
+    ----------
+    fn: str
+        Path to a TOML-formatted file
+
+    Returns
+    -------
+    data: dict
+        A copy of the parsed content of the file, that can be modified by the caller
+    """
+    fn = os.path.abspath(fn)
+    st = os.stat(fn)
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = toml_cache.get(fn)
+    if cached is None or cached[0] != key:
+        # Read whole file in a single unbuffered read, sized by the file itself
+        with open(fn, "rb", buffering=0) as f:
+            cached = (key, _tomllib.loads(f.read().decode()))
+        toml_cache[fn] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def _dumps_toml(data: Dict[str, Any]) -> str:
+    """
+    Serializes data to a TOML-formatted string, with tomli_w when it is installed, otherwise with toml.
+
+    Keys with None values are left out, as TOML has no null value.
+
+    Parameters
+    ----------
+    data: dict
+        A Python dictionary to be serialized
+
+    Returns
+    -------
+    content: str
+        TOML-formatted content of data
+    """
+    if _tomli_w is None:
+        return toml.dumps(data)
+
+    def _drop_none(table: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: _drop_none(value) if isinstance(value, dict) else value
+            for key, value in table.items()
+            if value is not None
+        }
+
+    return _tomli_w.dumps(_drop_none(data))
+
+
+@lru_cache(maxsize=256)
+def _load_job_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Loads job information from a TOML-formatted file, with pdb and ligand names and manually added id fixed.
+
+    The result is cached for each path, modification time and size of the file, so the file is only parsed again after it is modified, e.g. by Job.save. The returned dictionary is shared and must be copied before modified.
+
+    Parameters
+    ----------
+    path: str
+        Absolute path to a TOML-formatted file containing job information
+    mtime_ns: int
+        Modification time of the file (nanoseconds)
+    size: int
+        Size of the file (bytes)
+
+    Returns
+    -------
+    job_info: dict
+        Job information loaded from the file
+    """
+    # Parse the file here, this function already caches its content
+    with open(path, "rb", buffering=0) as f:
+        job_info = _tomllib.loads(f.read().decode())
+
+    # Fix pdb and ligand in job_info
+    if "pdb" in job_info["files"].keys():
+        job_info["files"]["pdb"] = _get_pdb_name(job_info["files"]["pdb"])
+    if "ligand" in job_info["files"].keys():
+        job_info["files"]["ligand"] = _get_pdb_name(job_info["files"]["ligand"])
+
+    # Treat manually added id
+    if "id_added_manually" in job_info.keys():
+        if job_info["id_added_manually"]:
+            job_info["modes"] = None
+            job_info["step_size"] = None
+            job_info["probes"] = None
+            job_info["cutoffs"] = None
+            job_info["visiblebox"] = None
+            job_info["internalbox"] = None
+
+    return job_info
+
+
+@lru_cache(maxsize=128)
+def _get_rotation_matrix(angle1: float, angle2: float) -> np.ndarray:
+    """
+    Gets the rotation matrix of a custom box.
+
+    The matrix is cached for each pair of angles, so redrawing a box without rotating it does not recompute it.
+
+    Parameters
+    ----------
+    angle1: float
+        Angle 1 of the custom box (radians)
+    angle2: float
+        Angle 2 of the custom box (radians)
+
+    Returns
+    -------
+    rotation: numpy.ndarray
+        A read-only 3x3 NumPy array with the rotation matrix
+    """
+    c1, s1 = cos(angle1), sin(angle1)
+    c2, s2 = cos(angle2), sin(angle2)
+    rotation = np.array(
+        [[c2, -s1 * s2, c1 * s2], [0.0, c1, s1], [-s2, -s1 * c2, c1 * c2]]
+    )
+    rotation.flags.writeable = False
+
+    return rotation
+
+
+def _get_about_document() -> QtGui.QTextDocument:
+    """
+    Gets the about text as a QTextDocument, that is formatted and parsed from HTML only once, when first needed, and shared between dialogs.
+
+    Returns
+    -------
+    about_document: QtGui.QTextDocument
+        A QTextDocument with the about text
+    """
+    global about_document
 
-    # Get jobs availables in dir
-    jobs = os.listdir(d)
+    if about_document is None:
+        about_document = QtGui.QTextDocument()
+        about_document.setHtml(
+            _ABOUT_TEMPLATE.format(days_job_expire, "s" if days_job_expire > 1 else "")
+        )
 
-    return jobs
+    return about_document
 
 
-about_text = """
+_ABOUT_TEMPLATE = """
 <!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" "http://www.w3.org/TR/REC-html40/strict.dtd">
 <html><head><meta name="qrichtext" content="1" /><style type="text/css"></style></head><body style=" font-family:'Sans Serif'; font-size:10pt; font-weight:400; font-style:normal;">
 <p style=" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">PyMOL KVFinder-web Tools integrates PyMOL (<a href="http://PyMOL.org/"><span style=" text-decoration: underline; color:#0000ff;">http://PyMOL.org/</span></a>) with KVFinder-web service.</p>
@@ -3773,6 +3967,4 @@ about_text = """
 <p style=" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">Guerra, J.V.d., Ribeiro-Filho, H.V., Jara, G.E. et al. pyKVFinder: an efficient and integrable Python package for biomolecular cavity detection and characterization in data science. BMC Bioinformatics 22, 607 (2021). <a href="https://doi.org/10.1186/s12859-021-04519-4"><span style=" text-decoration: underline; color:#0000ff;">https://doi.org/10.1186/s12859-021-04519-4</span></a>.</p>
 <p style=" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;">PyMOL citation may be found here:</p>
 <p style=" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;"><a href="http://pymol.sourceforge.net/faq.html#CITE"><span style=" text-decoration: underline; color:#0000ff;">https://pymol.org/2/support.html?</span></a></p></body></html>
-""".format(
-    days_job_expire, "s" if days_job_expire > 1 else ""
-)
+"""